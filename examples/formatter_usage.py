@@ -12,6 +12,26 @@ from aegis.agents.formatters import (
     format_task_list,
 )
 
+# Template for one section of the long-response example; parsed once and
+# reused for every section instead of rebuilding an f-string per iteration.
+_SECTION_TEMPLATE = """
+## Section {n}
+
+This is section {n} of a very long response. It contains detailed
+analysis and recommendations for improving your codebase.
+
+Key points:
+- Point 1 for section {n}
+- Point 2 for section {n}
+- Point 3 for section {n}
+
+```python
+def function_{i}():
+    # Implementation for section {n}
+    return "result_{i}"
+```
+"""
+
 
 def example_basic_response():
     """Example: Basic response formatting."""
@@ -101,27 +121,7 @@ def example_long_response():
     print("=" * 60)
 
     # Create a long response that will be split
-    sections = []
-    for i in range(100):
-        sections.append(f"""
-## Section {i + 1}
-
-This is section {i + 1} of a very long response. It contains detailed
-analysis and recommendations for improving your codebase.
-
-Key points:
-- Point 1 for section {i + 1}
-- Point 2 for section {i + 1}
-- Point 3 for section {i + 1}
-
-```python
-def function_{i}():
-    # Implementation for section {i + 1}
-    return "result_{i}"
-```
-""")
-
-    content = "\n".join(sections)
+    content = "\n".join(_SECTION_TEMPLATE.format(n=i + 1, i=i) for i in range(100))
     result = format_response(content, status=TaskStatus.IN_PROGRESS)
 
     print(f"Total length: {result.total_length:,} chars")
@@ -166,11 +166,15 @@ def main():
         print(f"     Total Score: {score.total_score:.2f}")
         print()
         print("     Score Breakdown:")
-        print(f"       • Due Date:       {score.due_date_score:.2f} × {weights.due_date:.1f} = {score.due_date_score * weights.due_date:.2f}")
-        print(f"       • Dependencies:   {score.dependency_score:.2f} × {weights.dependency:.1f} = {score.dependency_score * weights.dependency:.2f}")
-        print(f"       • User Priority:  {score.user_priority_score:.2f} × {weights.user_priority:.1f} = {score.user_priority_score * weights.user_priority:.2f}")
-        print(f"       • Project:        {score.project_score:.2f} × {weights.project_importance:.1f} = {score.project_score * weights.project_importance:.2f}")
-        print(f"       • Age:            {score.age_score:.2f} × {weights.age_factor:.1f} = {score.age_score * weights.age_factor:.2f}")
+        components = (
+            ("Due Date:      ", score.due_date_score, weights.due_date),
+            ("Dependencies:  ", score.dependency_score, weights.dependency),
+            ("User Priority: ", score.user_priority_score, weights.user_priority),
+            ("Project:       ", score.project_score, weights.project_importance),
+            ("Age:           ", score.age_score, weights.age_factor),
+        )
+        for label, raw, weight in components:
+            print(f"       • {label} {raw:.2f} × {weight:.1f} = {raw * weight:.2f}")
 
         # Add context
         if task.due_on:
@@ -11,15 +11,15 @@ Example:
 """
 
 import asyncio
+import re
 import sys
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from aegis.agents.simple_executor import SimpleExecutor
-from aegis.asana.client import AsanaClient
-from aegis.config import Settings
+# "Code Location: <path>" line in a project's notes
+_CODE_LOC_RE = re.compile(r"(?m)^Code Location:(.*)$")
 
 
 async def main():
@@ -32,9 +32,14 @@ async def main():
 
     task_gid = sys.argv[1]
 
+    # Deferred so the usage error path doesn't pay for the agent/Asana import graph
+    from aegis.agents.simple_executor import SimpleExecutor
+    from aegis.asana.client import AsanaClient
+    from aegis.config import get_settings
+
     # Load configuration
     print("Loading configuration...")
-    config = Settings()
+    config = get_settings()
 
     # Initialize clients
     print("Initializing Asana client...")
@@ -58,11 +63,9 @@ async def main():
         project_name = project.name
         # Try to get code path from project notes
         project_details = await asana_client.get_project(project.gid)
-        if project_details.notes:
-            for line in project_details.notes.split("\n"):
-                if line.startswith("Code Location:"):
-                    code_path = line.split(":", 1)[1].strip()
-                    break
+        match = _CODE_LOC_RE.search(project_details.notes or "")
+        if match:
+            code_path = match.group(1).strip()
 
     print(f"Project: {project_name}")
     if code_path:
@@ -1,13 +1,30 @@
+import argparse
+
 import asana
-import inspect
+
+parser = argparse.ArgumentParser(description="Inspect the Asana SDK API classes")
+parser.add_argument(
+    "--signatures", action="store_true", help="Also print SectionsApi method signatures"
+)
+args = parser.parse_args()
+
+# vars() reads the class __dict__ directly; dir() would walk the whole MRO
+section_methods = [m for m in vars(asana.SectionsApi) if not m.startswith("_")]
 
 print("SectionsApi methods:")
-for m in dir(asana.SectionsApi):
-    if not m.startswith("_"):
+if args.signatures:
+    import inspect
+
+    for m in section_methods:
+        print(f"  {m}{inspect.signature(getattr(asana.SectionsApi, m))}")
+else:
+    for m in section_methods:
         print(f"  {m}")
 
 print("\nProjectsApi.add_custom_field_setting_for_project signature:")
 try:
+    import inspect
+
     print(inspect.signature(asana.ProjectsApi.add_custom_field_setting_for_project))
 except Exception as e:
     print(e)
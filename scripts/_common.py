@@ -0,0 +1,63 @@
+"""Shared bootstrap helpers for the scripts in this directory.
+
+Usage (at the top of a script, before any ``aegis`` import):
+
+    from _common import bootstrap_path, get_client
+
+    bootstrap_path()
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asana
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+
+
+def bootstrap_path() -> None:
+    """Make the in-repo ``aegis`` package importable.
+
+    Safe to call repeatedly; the path is only inserted once so the import
+    system's path caches aren't invalidated on every call.
+    """
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+
+
+def get_client() -> asana.ApiClient:
+    """Get the process-wide Asana API client for the configured access token.
+
+    Returns:
+        Shared asana.ApiClient (see aegis.asana.client.get_asana_api_client)
+    """
+    bootstrap_path()
+
+    from aegis.asana.client import get_asana_api_client
+    from aegis.config import get_settings
+
+    return get_asana_api_client(get_settings().asana_access_token)
+
+
+@functools.cache
+def get_asana_client():
+    """Get the process-wide high-level AsanaClient for the configured token.
+
+    Cached so repeated calls (e.g. once per project in populate_tasks.py)
+    reuse the same API wrappers and in-memory lookup cache. Scripts are
+    short-lived, so project and section lookups are cached for the run.
+
+    Returns:
+        Shared aegis.asana.client.AsanaClient
+    """
+    bootstrap_path()
+
+    from aegis.asana.client import AsanaClient
+    from aegis.config import get_settings
+
+    return AsanaClient(get_settings().asana_access_token, cache_ttl=300)
@@ -2,29 +2,27 @@
 """Add an existing project to the Aegis portfolio."""
 
 import asyncio
-import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from _common import bootstrap_path, get_client
+
+bootstrap_path()
 
 import asana
 
 from aegis.config import get_settings
 
 
-async def add_to_portfolio(project_gid: str) -> None:
+async def add_to_portfolio(project_gid: str, verbose: bool = False) -> None:
     """Add a project to the Aegis portfolio.
 
     Args:
         project_gid: Project GID to add
+        verbose: Print the full traceback on failure
     """
     settings = get_settings()
 
-    # Configure API client
-    configuration = asana.Configuration()
-    configuration.access_token = settings.asana_access_token
-    api_client = asana.ApiClient(configuration)
+    api_client = get_client()
 
     portfolios_api = asana.PortfoliosApi(api_client)
 
@@ -42,9 +40,10 @@ async def add_to_portfolio(project_gid: str) -> None:
         print(f"✓ Added to portfolio: https://app.asana.com/0/portfolio/{portfolio_gid}")
 
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"Error: {type(e).__name__}: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -53,7 +52,8 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Add project to Aegis portfolio")
     parser.add_argument("project_gid", help="Project GID to add")
+    parser.add_argument("--verbose", action="store_true", help="Print full traceback on failure")
 
     args = parser.parse_args()
 
-    asyncio.run(add_to_portfolio(args.project_gid))
+    asyncio.run(add_to_portfolio(args.project_gid, verbose=args.verbose))
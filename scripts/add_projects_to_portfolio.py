@@ -2,25 +2,30 @@
 """Add all active workspace projects to the Aegis portfolio."""
 
 import asyncio
-import os
-import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from _common import bootstrap_path, get_client
+
+bootstrap_path()
 
 import asana
 
+from aegis.asana.client import asana_retry
 from aegis.config import get_settings
 
+# Maximum number of add requests in flight at once
+ADD_CONCURRENCY = 5
+
+
+async def add_projects_to_portfolio(portfolio_gid: str, verbose: bool = False) -> None:
+    """Add all active workspace projects to the specified portfolio.
 
-async def add_projects_to_portfolio(portfolio_gid: str) -> None:
-    """Add all active workspace projects to the specified portfolio."""
+    Args:
+        portfolio_gid: Portfolio to add the projects to
+        verbose: Print full tracebacks for failures
+    """
     settings = get_settings()
 
-    # Configure API client
-    configuration = asana.Configuration()
-    configuration.access_token = settings.asana_access_token
-    api_client = asana.ApiClient(configuration)
+    api_client = get_client()
 
     projects_api = asana.ProjectsApi(api_client)
     portfolios_api = asana.PortfoliosApi(api_client)
@@ -29,37 +34,49 @@ async def add_projects_to_portfolio(portfolio_gid: str) -> None:
         workspace_gid = settings.asana_workspace_gid
         print(f"Fetching all projects in workspace {workspace_gid}...")
 
-        # Get all active projects in workspace
-        projects_list = await asyncio.to_thread(
-            projects_api.get_projects,
-            {
+        # Get all active projects in workspace; archived ones are filtered
+        # server-side so they never cross the wire
+        active_projects = await asyncio.to_thread(
+            lambda: list(projects_api.get_projects({
                 "workspace": workspace_gid,
-                "opt_fields": "name,gid,archived"
-            }
+                "archived": False,
+                "limit": 100,
+                "opt_fields": "name,gid"
+            }))
         )
 
-        active_projects = [p for p in projects_list if not p.get('archived')]
-
         print(f"Found {len(active_projects)} active projects")
         print(f"\nAdding projects to portfolio {portfolio_gid}...")
 
-        added_count = 0
-        failed_count = 0
-
-        for project in active_projects:
-            try:
-                # Add project to portfolio
-                await asyncio.to_thread(
-                    portfolios_api.add_item_for_portfolio,
-                    {"data": {"project": project['gid']}},
-                    portfolio_gid
-                )
-                print(f"  ✓ Added: {project['name']}")
-                added_count += 1
-            except Exception as e:
-                # Project might already be in portfolio or other error
-                print(f"  ✗ Failed: {project['name']} - {str(e)[:50]}")
-                failed_count += 1
+        # Asana allows ~150 requests/min, so keep only a few adds in flight
+        # and back off with jitter on 429/5xx responses.
+        sem = asyncio.Semaphore(ADD_CONCURRENCY)
+        add_item = asana_retry(portfolios_api.add_item_for_portfolio)
+
+        async def _add(project: dict) -> tuple[dict, Exception | None]:
+            async with sem:
+                try:
+                    await asyncio.to_thread(
+                        add_item,
+                        {"data": {"project": project['gid']}},
+                        portfolio_gid
+                    )
+                except Exception as e:
+                    return project, e
+            print(f"  ✓ Added: {project['name']}")
+            return project, None
+
+        results = await asyncio.gather(*(_add(project) for project in active_projects))
+
+        failed = [(project, error) for project, error in results if error is not None]
+        for project, error in failed:
+            # Project might already be in portfolio or other error
+            print(f"  ✗ Failed: {project['name']} - {type(error).__name__}: {str(error)[:80]}")
+            if verbose:
+                import traceback
+                traceback.print_exception(error)
+        failed_count = len(failed)
+        added_count = len(results) - failed_count
 
         print(f"\n{'='*60}")
         print("Summary:")
@@ -74,12 +91,19 @@ async def add_projects_to_portfolio(portfolio_gid: str) -> None:
         print(f"ASANA_PROJECT_GIDS={project_gids}")
 
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"Error: {type(e).__name__}: {e}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Add all active projects to Aegis portfolio")
+    parser.add_argument("--verbose", action="store_true", help="Print full tracebacks on failure")
+    args = parser.parse_args()
+
     # Portfolio GID from the URL: https://app.asana.com/0/portfolio/1212078048284635/1212085171241424
     portfolio_gid = "1212078048284635"
 
@@ -87,4 +111,4 @@ if __name__ == "__main__":
     print("Adding all active projects to Aegis portfolio")
     print(f"{'='*60}\n")
 
-    asyncio.run(add_projects_to_portfolio(portfolio_gid))
+    asyncio.run(add_projects_to_portfolio(portfolio_gid, verbose=args.verbose))
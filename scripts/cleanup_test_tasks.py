@@ -5,7 +5,7 @@ This script removes test tasks created during integration testing.
 It safely deletes only tasks that match the E2E test pattern.
 
 Usage:
-    python scripts/cleanup_test_tasks.py [--dry-run] [--project-gid GID]
+    python scripts/cleanup_test_tasks.py [--dry-run] [--verbose] [--project-gid GID]
 
 Environment Variables:
     ASANA_ACCESS_TOKEN: Asana Personal Access Token
@@ -17,30 +17,52 @@ import asyncio
 import os
 import sys
 
-import asana
-from rich.console import Console
-from rich.table import Table
+from _common import bootstrap_path, get_client
 
-console = Console()
+bootstrap_path()
 
+# Name prefix used by the E2E suite for the tasks it creates
+TEST_TASK_PREFIX = "E2E_TEST_"
 
-async def cleanup_test_tasks(project_gid: str, dry_run: bool = False) -> None:
+# Asana's workspace task search returns at most this many results
+SEARCH_RESULT_LIMIT = 100
+
+# Asana's Batch API accepts at most this many actions per request
+BATCH_SIZE = 10
+
+# Maximum number of batch requests in flight at once
+BATCH_CONCURRENCY = 5
+
+# Above this many tasks the listing is printed as plain text, not a rich table
+PLAIN_TABLE_THRESHOLD = 200
+
+
+async def cleanup_test_tasks(
+    project_gid: str, dry_run: bool = False, verbose: bool = False
+) -> None:
     """Clean up test tasks from an Asana project.
 
     Args:
         project_gid: GID of the project to clean
         dry_run: If True, only show what would be deleted without actually deleting
+        verbose: Print full tracebacks for failures
     """
+    # Heavy imports deferred so --help and argument errors stay fast
+    import asana
+    from asana.rest import ApiException
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+    console = Console()
+
     try:
         access_token = os.getenv("ASANA_ACCESS_TOKEN")
         if not access_token:
             console.print("[red]Error: ASANA_ACCESS_TOKEN not set[/red]")
             sys.exit(1)
 
-        # Configure API client
-        configuration = asana.Configuration()
-        configuration.access_token = access_token
-        api_client = asana.ApiClient(configuration)
+        api_client = get_client()
         tasks_api = asana.TasksApi(api_client)
         projects_api = asana.ProjectsApi(api_client)
 
@@ -49,50 +71,83 @@ async def cleanup_test_tasks(project_gid: str, dry_run: bool = False) -> None:
         project = await asyncio.to_thread(
             projects_api.get_project,
             project_gid,
-            {"opt_fields": "name,gid"}
+            {"opt_fields": "name,gid,workspace.gid"}
         )
         console.print(f"Project: {project['name']}\n")
 
-        # Get all tasks
         console.print("Fetching tasks...")
-        tasks_generator = await asyncio.to_thread(
-            tasks_api.get_tasks_for_project,
-            project_gid,
-            {"opt_fields": "name,gid,completed,created_at,permalink_url"}
-        )
-        all_tasks = list(tasks_generator)
-
-        # Filter test tasks
-        test_tasks = [
-            task for task in all_tasks
-            if task["name"].startswith("E2E_TEST_")
-        ]
+        opt_fields = "name,gid,completed,created_at"
+
+        def _search_test_tasks() -> list[dict] | None:
+            results = list(tasks_api.search_tasks_for_workspace(
+                project["workspace"]["gid"],
+                {
+                    "text": TEST_TASK_PREFIX,
+                    "projects.any": project_gid,
+                    "opt_fields": opt_fields,
+                },
+            ))
+            # Asana's text search is substring-based, so keep the prefix check
+            matches = [task for task in results if task["name"].startswith(TEST_TASK_PREFIX)]
+            if not matches or len(results) >= SEARCH_RESULT_LIMIT:
+                # Nothing found (tasks from a just-finished run may not be
+                # indexed yet) or possibly truncated; let the caller scan instead
+                return None
+            return matches
+
+        def _scan_test_tasks() -> list[dict]:
+            # Filter while paging so non-test tasks are never retained
+            return [
+                task
+                for task in tasks_api.get_tasks_for_project(
+                    project_gid, {"opt_fields": opt_fields}
+                )
+                if task["name"].startswith(TEST_TASK_PREFIX)
+            ]
+
+        # Prefer server-side search so only matching tasks cross the wire.
+        # Search is a premium feature, eventually consistent and returns at
+        # most 100 results, so fall back to scanning the project when it's
+        # unavailable, finds nothing or may be truncated.
+        try:
+            test_tasks = await asyncio.to_thread(_search_test_tasks)
+        except ApiException as e:
+            console.print(f"[yellow]Task search unavailable ({e.status}), scanning project[/yellow]")
+            test_tasks = None
+        if test_tasks is None:
+            test_tasks = await asyncio.to_thread(_scan_test_tasks)
 
         if not test_tasks:
             console.print("[green]No test tasks found. Nothing to clean up![/green]")
             return
 
         # Display tasks to be deleted
-        table = Table(title=f"Test Tasks to {'Review' if dry_run else 'Delete'}")
-        table.add_column("Name", style="cyan")
-        table.add_column("GID", style="magenta")
-        table.add_column("Completed", style="yellow")
-        table.add_column("Created", style="blue")
-
-        for task in test_tasks:
-            completed_status = "✓" if task.get("completed") else "✗"
-            created_at = task.get("created_at", "Unknown")
-            if isinstance(created_at, str) and "T" in created_at:
-                created_at = created_at.split("T")[0]
-
-            table.add_row(
+        title = f"Test Tasks to {'Review' if dry_run else 'Delete'}"
+        rows = [
+            (
                 task["name"],
                 task["gid"],
-                completed_status,
-                str(created_at)
+                "✓" if task.get("completed") else "✗",
+                str(task.get("created_at") or "Unknown").split("T")[0],
             )
+            for task in test_tasks
+        ]
+
+        if len(rows) > PLAIN_TABLE_THRESHOLD or not console.is_terminal:
+            # Rich measures every cell to lay out the table; plain lines are
+            # enough for big listings and non-interactive (CI) output
+            print(title)
+            print("\n".join(" | ".join(row) for row in rows))
+        else:
+            table = Table(title=title)
+            table.add_column("Name", style="cyan")
+            table.add_column("GID", style="magenta")
+            table.add_column("Completed", style="yellow")
+            table.add_column("Created", style="blue")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
 
-        console.print(table)
         console.print(f"\n[bold]Total test tasks found: {len(test_tasks)}[/bold]\n")
 
         if dry_run:
@@ -108,33 +163,55 @@ async def cleanup_test_tasks(project_gid: str, dry_run: bool = False) -> None:
             console.print("[yellow]Cancelled by user[/yellow]")
             return
 
-        # Delete tasks
+        # Delete via the Batch API, which folds up to 10 deletes into one
+        # HTTP request; a few batches run concurrently under the rate limit
         console.print("\n[bold]Deleting tasks...[/bold]")
+        batch_api = asana.BatchAPIApi(api_client)
+        sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+        windows = [
+            test_tasks[i:i + BATCH_SIZE] for i in range(0, len(test_tasks), BATCH_SIZE)
+        ]
+
         deleted_count = 0
         failed_count = 0
 
-        for task in test_tasks:
-            try:
-                # Mark as completed first (softer delete)
-                await asyncio.to_thread(
-                    tasks_api.update_task,
-                    {"data": {"completed": True}},
-                    task["gid"],
-                    {}
-                )
-
-                # Then delete
-                await asyncio.to_thread(
-                    tasks_api.delete_task,
-                    task["gid"]
-                )
-
-                console.print(f"  [green]✓[/green] Deleted: {task['name']}")
-                deleted_count += 1
-
-            except Exception as e:
-                console.print(f"  [red]✗[/red] Failed to delete {task['name']}: {e}")
-                failed_count += 1
+        with Progress(console=console) as progress:
+            progress_task = progress.add_task("Deleting", total=len(test_tasks))
+
+            async def _delete_window(window: list[dict]) -> None:
+                nonlocal deleted_count, failed_count
+                actions = [
+                    {"relative_path": f"/tasks/{task['gid']}", "method": "delete"}
+                    for task in window
+                ]
+                try:
+                    async with sem:
+                        responses = await asyncio.to_thread(
+                            lambda: list(batch_api.create_batch_request(
+                                {"data": {"actions": actions}}, {}
+                            ))
+                        )
+                except Exception as e:
+                    if verbose:
+                        progress.console.print_exception()
+                    responses = [
+                        {"status_code": None, "body": f"{type(e).__name__}: {str(e)[:80]}"}
+                    ] * len(window)
+
+                # Batch responses come back in the same order as the actions
+                for task, response in zip(window, responses):
+                    status = response.get("status_code")
+                    if status is not None and 200 <= status < 300:
+                        deleted_count += 1
+                    else:
+                        progress.console.print(
+                            f"  [red]✗[/red] Failed to delete {task['name']}: "
+                            f"{status} {response.get('body')}"
+                        )
+                        failed_count += 1
+                progress.advance(progress_task, len(window))
+
+            await asyncio.gather(*(_delete_window(window) for window in windows))
 
         # Summary
         console.print("\n[bold]Cleanup Summary[/bold]")
@@ -144,9 +221,10 @@ async def cleanup_test_tasks(project_gid: str, dry_run: bool = False) -> None:
         console.print("\n[green]✓ Cleanup complete![/green]")
 
     except Exception as e:
-        console.print(f"[red]Error during cleanup: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        console.print(f"[red]Error during cleanup: {type(e).__name__}: {e}[/red]")
+        if verbose:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -164,6 +242,11 @@ def main() -> None:
         action="store_true",
         help="Show what would be deleted without actually deleting",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print full tracebacks on failure",
+    )
 
     args = parser.parse_args()
 
@@ -171,14 +254,18 @@ def main() -> None:
     project_gid = args.project_gid or os.getenv("ASANA_TEST_PROJECT_GID")
 
     if not project_gid:
-        console.print(
+        from rich.console import Console
+
+        Console().print(
             "[red]Error: Project GID required. "
             "Use --project-gid or set ASANA_TEST_PROJECT_GID[/red]"
         )
         sys.exit(1)
 
     # Run cleanup
-    asyncio.run(cleanup_test_tasks(project_gid, dry_run=args.dry_run))
+    asyncio.run(
+        cleanup_test_tasks(project_gid, dry_run=args.dry_run, verbose=args.verbose)
+    )
 
 
 if __name__ == "__main__":
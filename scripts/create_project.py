@@ -5,13 +5,15 @@ import asyncio
 import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from _common import bootstrap_path, get_asana_client
 
-import asana
+bootstrap_path()
 
 from aegis.config import get_settings
 
+NOTES_HEADER = "Code managed by Aegis\n"
+PORTFOLIO_URL = "https://app.asana.com/0/portfolio/{}"
+
 
 async def create_project(name: str, code_path: str | None = None) -> str:
     """Create a new Asana project and add it to the Aegis portfolio.
@@ -25,27 +27,21 @@ async def create_project(name: str, code_path: str | None = None) -> str:
     """
     settings = get_settings()
 
-    # Configure API client
-    configuration = asana.Configuration()
-    configuration.access_token = settings.asana_access_token
-    api_client = asana.ApiClient(configuration)
-
-    projects_api = asana.ProjectsApi(api_client)
-    portfolios_api = asana.PortfoliosApi(api_client)
-    teams_api = asana.TeamsApi(api_client)
+    client = get_asana_client()
 
     try:
         workspace_gid = settings.asana_workspace_gid
         portfolio_gid = settings.asana_portfolio_gid
+        portfolio_url = PORTFOLIO_URL.format(portfolio_gid)
+
+        # Build project notes (home directory expanded in the code path)
+        notes = NOTES_HEADER
+        if code_path:
+            notes = f"{NOTES_HEADER}\nCode Location: {os.path.expanduser(code_path)}"
 
-        # Get teams in workspace
+        # Only the first team is used, so ask for a single result
         print(f"Getting teams in workspace {workspace_gid}...")
-        teams_generator = await asyncio.to_thread(
-            teams_api.get_teams_for_workspace,
-            workspace_gid,
-            {}
-        )
-        teams_list = list(teams_generator)
+        teams_list = await client.get_teams(workspace_gid, limit=1)
 
         if not teams_list:
             print("Error: No teams found in workspace. Projects require a team.")
@@ -58,31 +54,12 @@ async def create_project(name: str, code_path: str | None = None) -> str:
 
         print(f"\nCreating project '{name}'...")
 
-        # Build project notes
-        notes = "Code managed by Aegis\n"
-        if code_path:
-            # Expand home directory
-            expanded_path = os.path.expanduser(code_path)
-            notes += f"\nCode Location: {expanded_path}"
-
-        # Create project
-        project_data = {
-            "data": {
-                "name": name,
-                "team": team_gid,
-                "notes": notes,
-                "public": False,
-            }
-        }
-
-        project_dict = await asyncio.to_thread(
-            projects_api.create_project,
-            project_data,
-            {"opt_fields": "name,gid,permalink_url"}
+        project = await client.create_project(
+            workspace_gid, name, notes=notes, public=False, team_gid=team_gid
         )
 
-        project_gid = project_dict['gid']
-        project_url = project_dict.get('permalink_url', '')
+        project_gid = project.gid
+        project_url = project.permalink_url
 
         print(f"✓ Created project: {name}")
         print(f"  GID: {project_gid}")
@@ -92,15 +69,11 @@ async def create_project(name: str, code_path: str | None = None) -> str:
         # Try to add to Aegis portfolio
         print("\nAdding project to Aegis portfolio...")
         try:
-            await asyncio.to_thread(
-                portfolios_api.add_item_for_portfolio,
-                {"data": {"item": project_gid}},
-                portfolio_gid
-            )
-            print(f"✓ Added to portfolio: https://app.asana.com/0/portfolio/{portfolio_gid}")
+            await client.add_project_to_portfolio(portfolio_gid, project_gid)
+            print(f"✓ Added to portfolio: {portfolio_url}")
         except Exception as e:
             print(f"⚠ Could not auto-add to portfolio: {e}")
-            print(f"  Please add manually at: https://app.asana.com/0/portfolio/{portfolio_gid}")
+            print(f"  Please add manually at: {portfolio_url}")
 
         return project_gid
 
@@ -2,66 +2,65 @@
 """List all projects in the Softmax workspace."""
 
 import asyncio
-import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from _common import bootstrap_path, get_asana_client
 
-import asana
+bootstrap_path()
 
 from aegis.config import get_settings
 
+# Projects per API page, and per buffered write of the listing
+PAGE_SIZE = 100
+
 
 async def list_workspace_projects() -> None:
     """List all projects in the workspace."""
     settings = get_settings()
 
-    # Configure API client
-    configuration = asana.Configuration()
-    configuration.access_token = settings.asana_access_token
-    api_client = asana.ApiClient(configuration)
-
-    projects_api = asana.ProjectsApi(api_client)
+    client = get_asana_client()
 
     try:
         workspace_gid = settings.asana_workspace_gid
         print(f"Fetching all projects in workspace {workspace_gid}...")
 
-        # Get all projects in workspace
-        projects_list = await asyncio.to_thread(
-            projects_api.get_projects,
-            {
-                "workspace": workspace_gid,
-                "opt_fields": "name,gid,archived,public"
-            }
-        )
-
-        active_projects = []
+        # Stream projects page by page, printing active ones as they arrive.
+        # Output is buffered and written once per page rather than per line.
+        active_gids = []
         archived_projects = []
-
-        for project_dict in projects_list:
-            if project_dict.get('archived'):
-                archived_projects.append(project_dict)
-            else:
-                active_projects.append(project_dict)
+        lines = []
 
         print(f"\n{'='*60}")
-        print(f"Active Projects ({len(active_projects)}):")
+        print("Active Projects:")
         print(f"{'='*60}")
-        for project in active_projects:
+        async for project in client.iter_projects(
+            workspace_gid, opt_fields="name,gid,archived,public", page_size=PAGE_SIZE
+        ):
+            if project.get('archived'):
+                archived_projects.append(project)
+                continue
+
+            active_gids.append(project['gid'])
             visibility = "Public" if project.get('public') else "Private"
-            print(f"  - {project['name']}")
-            print(f"    GID: {project['gid']}")
-            print(f"    Visibility: {visibility}")
-            print()
+            lines.append(
+                f"  - {project['name']}\n"
+                f"    GID: {project['gid']}\n"
+                f"    Visibility: {visibility}\n\n"
+            )
+            if len(lines) >= PAGE_SIZE:
+                sys.stdout.write("".join(lines))
+                lines.clear()
+        sys.stdout.write("".join(lines))
+        print(f"({len(active_gids)} active)")
 
         if archived_projects:
             print(f"\n{'='*60}")
             print(f"Archived Projects ({len(archived_projects)}):")
             print(f"{'='*60}")
-            for project in archived_projects:
-                print(f"  - {project['name']} (GID: {project['gid']})")
+            sys.stdout.write("".join(
+                f"  - {project['name']} (GID: {project['gid']})\n"
+                for project in archived_projects
+            ))
 
         # Generate instructions
         print(f"\n{'='*60}")
@@ -75,8 +74,8 @@ async def list_workspace_projects() -> None:
         print(f"{'='*60}")
 
         # Show what to add to .env after adding projects to portfolio
-        if active_projects:
-            project_gids = ",".join([p['gid'] for p in active_projects])
+        if active_gids:
+            project_gids = ",".join(active_gids)
             print("\nAfter adding projects to portfolio, update .env:")
             print(f"ASANA_PROJECT_GIDS={project_gids}")
 
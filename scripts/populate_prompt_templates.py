@@ -8,18 +8,20 @@ Run this script once to set up the initial prompt templates:
     python scripts/populate_prompt_templates.py
 """
 
-import sys
-from pathlib import Path
+from _common import bootstrap_path
 
-# Add parent directory to path to import aegis
-sys.path.insert(0, str(Path(__file__).parent.parent))
+bootstrap_path()
 
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 
 from aegis.config import get_settings
 from aegis.database.models import PromptTemplate
 from aegis.database.session import get_db_session
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 # Template definitions
 TEMPLATES = [
     {
@@ -345,35 +347,41 @@ def populate_templates():
     with get_db_session() as session:
         print(f"\nPopulating {len(TEMPLATES)} prompt templates...")
 
-        for template_data in TEMPLATES:
-            # Check if template already exists
-            stmt = select(PromptTemplate).where(
-                PromptTemplate.name == template_data["name"],
-                PromptTemplate.agent_type == template_data["agent_type"],
-                PromptTemplate.version == template_data["version"],
+        rows = [
+            {
+                "name": template_data["name"],
+                "agent_type": template_data["agent_type"],
+                "version": template_data["version"],
+                "system_prompt": template_data["system_prompt"],
+                "user_prompt_template": template_data["user_prompt_template"],
+                "description": template_data.get("description"),
+                "tags": template_data.get("tags", []),
+                "variables": template_data.get("variables", []),
+                "active": True,
+                "created_by": "populate_script",
+            }
+            for template_data in TEMPLATES
+        ]
+
+        # One INSERT for all templates; rows that already exist hit the unique
+        # (name, agent_type, version) index and are skipped by the database
+        # itself, so there is no separate existence check to race against.
+        dialect_insert = _INSERTS[session.get_bind().dialect.name]
+        stmt = (
+            dialect_insert(PromptTemplate)
+            .on_conflict_do_nothing(index_elements=["name", "agent_type", "version"])
+            .returning(
+                PromptTemplate.name, PromptTemplate.agent_type, PromptTemplate.version
             )
-            existing = session.execute(stmt).scalar_one_or_none()
+        )
+        created = {tuple(row) for row in session.execute(stmt, rows)}
 
-            if existing:
+        for template_data in TEMPLATES:
+            key = (template_data["name"], template_data["agent_type"], template_data["version"])
+            if key in created:
+                print(f"  ✓ Created {template_data['name']} v{template_data['version']}")
+            else:
                 print(f"  ⊘ Skipping {template_data['name']} (already exists)")
-                continue
-
-            # Create new template
-            template = PromptTemplate(
-                name=template_data["name"],
-                agent_type=template_data["agent_type"],
-                version=template_data["version"],
-                system_prompt=template_data["system_prompt"],
-                user_prompt_template=template_data["user_prompt_template"],
-                description=template_data.get("description"),
-                tags=template_data.get("tags", []),
-                variables=template_data.get("variables", []),
-                active=True,
-                created_by="populate_script",
-            )
-
-            session.add(template)
-            print(f"  ✓ Created {template_data['name']} v{template_data['version']}")
 
         print("\n✓ All templates populated successfully!")
 
@@ -2,25 +2,17 @@
 """Helper script to extract workspace and project information from Asana portfolio."""
 
 import asyncio
-import os
-import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from _common import bootstrap_path, get_client
 
-import asana
+bootstrap_path()
 
-from aegis.config import get_settings
+import asana
 
 
 async def get_portfolio_info(portfolio_gid: str) -> None:
     """Get information about a portfolio including workspace and projects."""
-    settings = get_settings()
-
-    # Configure API client
-    configuration = asana.Configuration()
-    configuration.access_token = settings.asana_access_token
-    api_client = asana.ApiClient(configuration)
+    api_client = get_client()
 
     portfolios_api = asana.PortfoliosApi(api_client)
 
@@ -46,29 +38,29 @@ async def get_portfolio_info(portfolio_gid: str) -> None:
 
         # Get all projects in the portfolio
         print("\nFetching projects in portfolio...")
-        projects_list = await asyncio.to_thread(
-            portfolios_api.get_items_for_portfolio,
-            portfolio_gid,
-            {"opt_fields": "name,gid"}
-        )
+        def _collect_gids() -> list[str]:
+            # The SDK paginates lazily, so iterate in the worker thread and keep only GIDs
+            gids = []
+            for project_dict in portfolios_api.get_items_for_portfolio(
+                portfolio_gid, {"opt_fields": "name,gid"}
+            ):
+                print(f"  - {project_dict['name']} (GID: {project_dict['gid']})")
+                gids.append(project_dict["gid"])
+            return gids
 
-        projects = []
-        for project_dict in projects_list:
-            projects.append(project_dict)
-            print(f"  - {project_dict['name']} (GID: {project_dict['gid']})")
+        project_gids = await asyncio.to_thread(_collect_gids)
 
-        print(f"\nTotal projects: {len(projects)}")
+        print(f"\nTotal projects: {len(project_gids)}")
 
         # Generate .env entries
         print("\n" + "="*60)
         print("Add these to your .env file:")
         print("="*60)
         print(f"ASANA_WORKSPACE_GID={workspace_gid}")
-        project_gids = ",".join([p['gid'] for p in projects])
-        print(f"ASANA_PROJECT_GIDS={project_gids}")
+        print(f"ASANA_PROJECT_GIDS={','.join(project_gids)}")
         print("="*60)
 
-        return workspace_gid, [p['gid'] for p in projects]
+        return workspace_gid, project_gids
 
     except Exception as e:
         print(f"Error: {e}")
@@ -5,10 +5,10 @@ This script demonstrates how to use the prompt template system.
 """
 
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from _common import bootstrap_path
+
+bootstrap_path()
 
 from aegis.agents.prompts import PromptBuilder, PromptRenderer, PromptTemplateLoader
 
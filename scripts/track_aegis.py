@@ -1,31 +1,28 @@
 import asyncio
-import os
 from pathlib import Path
-from aegis.config import Settings
-from aegis.asana.client import AsanaClient
+
+from _common import bootstrap_path, get_asana_client
+
+bootstrap_path()
+
+from aegis.config import get_settings
 from aegis.core.tracker import ProjectTracker
 
 async def track_aegis():
-    settings = Settings()
-    client = AsanaClient(settings.asana_access_token)
+    settings = get_settings()
+    client = get_asana_client()
     tracker = ProjectTracker()
 
-    print("Fetching projects from workspace...")
-    # Use underlying API directly since wrapper is missing get_projects
-    projects = client.projects_api.get_projects(
-        {
-            'workspace': settings.asana_workspace_gid,
-            'archived': False,
-            'opt_fields': "name,gid"
-        }
+    print("Searching workspace for the Aegis project...")
+    # Server-side name search instead of listing every project in the workspace
+    matches = await client.typeahead(
+        settings.asana_workspace_gid, "project", "aegis", count=5, opt_fields="name,gid,archived"
     )
 
-    aegis_project = None
-    for p in projects:
-        print(f"Found project in workspace: {p['name']} ({p['gid']})")
-        if "aegis" in p['name'].lower():
-            aegis_project = p
-            break
+    aegis_project = next(
+        (p for p in matches if "aegis" in p['name'].lower() and not p.get('archived')),
+        None,
+    )
 
     if not aegis_project:
         print("Could not find project 'Aegis' in workspace.")
@@ -1,8 +1,7 @@
-import asyncio
 from pathlib import Path
 from aegis.core.tracker import ProjectTracker
 
-async def track_agents_project():
+def main():
     tracker = ProjectTracker()
 
     # Project: Agents
@@ -15,4 +14,4 @@ async def track_agents_project():
     print("Successfully added to tracking.")
 
 if __name__ == "__main__":
-    asyncio.run(track_agents_project())
+    main()
@@ -3,35 +3,70 @@
 Script to identify and uncomplete failed tasks in Aegis project.
 """
 import asyncio
+import re
 
 import structlog
+from _common import bootstrap_path, get_asana_client
 
-from aegis.asana.client import AsanaClient
+bootstrap_path()
+
+from aegis.asana.client import is_batch_success
 from aegis.asana.models import AsanaTaskUpdate
-from aegis.config import Settings
 
 logger = structlog.get_logger()
 
+# Maximum number of tasks having their comments scanned at once
+SCAN_CONCURRENCY = 10
+# Maximum number of fix-up batch requests (of up to 10 writes each) in flight at once
+FIX_CONCURRENCY = 5
+
+RETRY_COMMENT = (
+    "🔄 This task was marked as complete but the execution failed. "
+    "Moving back to 'Ready to Implement' for retry."
+)
+
+# Clear failure indicators, matched case-insensitively in a single pass
+FAILURE_RE = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in [
+            "❌ execution failed",
+            "failed with error",
+            "error:",
+            "exception:",
+            "traceback",
+            "failed to execute"
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 
 async def main():
     """Find failed tasks and move them back to Ready to Implement."""
-    config = Settings()
-    client = AsanaClient(config.asana_access_token)
+    client = get_asana_client()
 
     # Get Aegis project GID
     aegis_project_gid = "1212085431574340"
 
     print("Fetching tasks from Aegis project...")
 
-    # Get all tasks from the project
-    tasks = await client.get_tasks_from_project(aegis_project_gid, assigned_only=False)
+    async def list_completed_tasks() -> list[dict]:
+        # Filter while paging raw task dicts, so open tasks never become models
+        return [
+            task_dict
+            async for task_dict in client.iter_task_dicts(aegis_project_gid, "name,completed")
+            if task_dict.get("completed")
+        ]
+
+    # Tasks and sections are independent lookups, so fetch them together
+    completed_tasks, sections = await asyncio.gather(
+        list_completed_tasks(),
+        client.get_sections(aegis_project_gid),
+    )
 
-    # Filter for completed tasks
-    completed_tasks = [t for t in tasks if t.completed]
     print(f"Found {len(completed_tasks)} completed tasks")
 
-    # Get sections
-    sections = await client.get_sections(aegis_project_gid)
     sections_by_name = {s.name: s.gid for s in sections}
 
     print("\nAvailable sections:")
@@ -44,37 +79,30 @@ async def main():
         return
 
     # Check each completed task for failures
-    failed_tasks = []
-
     print(f"\nChecking {len(completed_tasks)} completed tasks for failures...")
 
-    for task in completed_tasks:
-        # Check comments for failure indicators
-        comments = await client.get_comments(task.gid)
-
-        has_failure = False
-        failure_comment = None
-
-        for comment in comments:
-            text = comment.text.lower()
-            # Look for clear failure indicators
-            if any(keyword in text for keyword in [
-                "❌ execution failed",
-                "failed with error",
-                "error:",
-                "exception:",
-                "traceback",
-                "failed to execute"
-            ]):
-                has_failure = True
-                failure_comment = comment.text
-                break
-
-        if has_failure:
-            print(f"\n❌ FAILED: {task.name} (GID: {task.gid})")
-            if failure_comment:
-                print(f"   Comment preview: {failure_comment[:300]}...")
-            failed_tasks.append((task, failure_comment))
+    scan_sem = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def check(task):
+        # Return the first comment with a failure indicator, leaving later pages unfetched
+        async with scan_sem:
+            async for comment in client.iter_comments(task['gid']):
+                if FAILURE_RE.search(comment.text):
+                    return comment.text
+        return None
+
+    results = await asyncio.gather(
+        *(check(task) for task in completed_tasks), return_exceptions=True
+    )
+
+    failed_tasks = []
+    for task, result in zip(completed_tasks, results):
+        if isinstance(result, Exception):
+            print(f"\n⚠ Could not check {task['name']} (GID: {task['gid']}): {result}")
+        elif result is not None:
+            print(f"\n❌ FAILED: {task['name']} (GID: {task['gid']})")
+            print(f"   Comment preview: {result[:300]}...")
+            failed_tasks.append((task, result))
 
     print(f"\n{'='*80}")
     print(f"Found {len(failed_tasks)} failed tasks")
@@ -87,40 +115,33 @@ async def main():
     # Show tasks to be processed
     print("Tasks to uncomplete and move back to 'Ready to Implement':")
     for i, (task, _) in enumerate(failed_tasks, 1):
-        print(f"{i}. {task.name}")
+        print(f"{i}. {task['name']}")
 
     print("\nProceeding with uncompleting these tasks...")
 
     # Uncomplete and move tasks
     print("\nProcessing tasks...")
-    for task, failure_comment in failed_tasks:
-        try:
-            # Uncomplete the task
-            await client.update_task(
-                task.gid,
-                AsanaTaskUpdate(completed=False)
-            )
-            print(f"✓ Uncompleted: {task.name}")
-
-            # Move to Ready to Implement section
-            await client.move_task_to_section(
-                task.gid,
-                aegis_project_gid,
-                ready_section_gid
-            )
-            print(f"✓ Moved to 'Ready to Implement': {task.name}")
-
-            # Add a comment explaining what happened
-            comment_text = (
-                "🔄 This task was marked as complete but the execution failed. "
-                "Moving back to 'Ready to Implement' for retry."
-            )
-
-            await client.add_comment(task.gid, comment_text)
-            print("✓ Added explanatory comment\n")
-
-        except Exception as e:
-            print(f"❌ Error processing {task.name}: {e}\n")
+    # Uncompleting, moving and commenting are independent writes, so queue
+    # them for every task in one save session and send them as batch requests
+    async with client.save_session() as session:
+        for task, _ in failed_tasks:
+            session.update_task(task['gid'], AsanaTaskUpdate(completed=False))
+            session.move_to_section(task['gid'], ready_section_gid)
+            session.add_comment(task['gid'], RETRY_COMMENT)
+
+        responses = await session.commit(max_concurrency=FIX_CONCURRENCY)
+
+    labels = ["Uncompleted", "Moved to 'Ready to Implement'", "Added explanatory comment"]
+    for i, (task, _) in enumerate(failed_tasks):
+        for label, response in zip(labels, responses[i * 3:i * 3 + 3]):
+            if is_batch_success(response):
+                print(f"✓ {label}: {task['name']}")
+            else:
+                print(
+                    f"❌ Error processing {task['name']} ({label}): "
+                    f"{response.get('status_code')} {response.get('body')}"
+                )
+        print()
 
     print(f"\n{'='*80}")
     print(f"Completed! Processed {len(failed_tasks)} tasks")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Upgrade an existing Master DB (.aegis/master.sqlite) to the current schema.
+
+The Master DB is created with SQLAlchemy's create_all, which never alters
+tables that already exist. Run this once after upgrading Aegis, with the
+master process and agents stopped:
+
+    python scripts/upgrade_master_db.py [--dry-run]
+
+Each step is idempotent, so running it again is safe.
+
+Steps:
+    - work_queue.heartbeat_at: lets agents take over abandoned claims
+"""
+
+import argparse
+import sys
+
+from _common import bootstrap_path
+
+bootstrap_path()
+
+# (table, column, DDL type) added since the Master DB schema was first created
+ADDED_COLUMNS = [
+    ("work_queue", "heartbeat_at", "DATETIME"),
+]
+
+
+def main() -> int:
+    """Add missing columns to the Master DB."""
+    parser = argparse.ArgumentParser(description="Upgrade the Aegis Master DB schema")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show what would change without altering the DB"
+    )
+    args = parser.parse_args()
+
+    from sqlalchemy import inspect, text
+
+    from aegis.database.session import get_db_url, get_engine, init_db
+
+    db_url = get_db_url()
+    print(f"Master DB: {db_url}")
+    engine = get_engine(db_url)
+    inspector = inspect(engine)
+
+    missing = [
+        (table, column, column_type)
+        for table, column, column_type in ADDED_COLUMNS
+        if inspector.has_table(table)
+        and column not in {c["name"] for c in inspector.get_columns(table)}
+    ]
+    if not missing:
+        print("✓ Schema is up to date")
+    for table, column, column_type in missing:
+        print(f"{'Would add' if args.dry_run else 'Adding'} {table}.{column} ({column_type})")
+    if args.dry_run:
+        return 0
+
+    with engine.begin() as conn:
+        for table, column, column_type in missing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+
+    # Creates any missing tables and indexes
+    init_db()
+    if missing:
+        print("✓ Master DB upgraded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,35 @@
 """Base agent contract for all swarm agents."""
 
+import asyncio
 import subprocess
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
 import structlog
-from sqlalchemy import select, update
 
 from aegis.asana.models import AsanaTask, AsanaProject
 from aegis.infrastructure.asana_service import AsanaService
 from aegis.utils.asana_utils import format_asana_resource
-from aegis.database.session import get_db_session
-from aegis.database.master_models import WorkQueueItem, AgentState
 
 logger = structlog.get_logger()
 
+# Repository-level prompts/ directory holding each agent's *.prompt.txt
+PROMPTS_DIR = Path(__file__).parents[3] / "prompts"
+
+# Lines of Claude Code output kept in memory by agents that only need the tail
+CLAUDE_OUTPUT_TAIL_LINES = 2000
+
+# A claim whose heartbeat_at hasn't been refreshed for this long is treated as
+# abandoned (e.g. its agent crashed) and can be taken over; claim holders refresh
+# every CLAIM_HEARTBEAT_SECONDS. Items without a heartbeat (assigned by the
+# master to worker processes) are never taken over.
+CLAIM_STALE_AFTER = timedelta(seconds=120)
+CLAIM_HEARTBEAT_SECONDS = 30
+
 
 class AgentTargetType(str, Enum):
     """Type of target an agent operates on."""
@@ -33,6 +45,47 @@ class AgentError(Exception):
 from aegis.core.models import AgentResult
 
 
+def _insert_if_no_active_work(model, resource_id: str, resource_type: str, **values):
+    """Build an INSERT ... SELECT that adds a work item only if none is active.
+
+    "Active" means pending or assigned. Checking and inserting in a single
+    statement saves a round-trip and closes the gap between a separate
+    existence check and the insert.
+
+    Args:
+        model: WorkQueueItem model class
+        resource_id: ID of the resource
+        resource_type: 'task' or 'project'
+        **values: Remaining column values for the new item
+
+    Returns:
+        Executable insert statement; its rowcount is 1 if a row was added
+    """
+    from sqlalchemy import exists, insert, literal, select
+
+    values = {"resource_id": resource_id, "resource_type": resource_type, **values}
+    active = exists().where(
+        model.resource_id == resource_id,
+        model.resource_type == resource_type,
+        model.status.in_(["pending", "assigned"]),
+    )
+    columns = [getattr(model, name) for name in values]
+    row = select(
+        *(literal(value, type_=column.type) for value, column in zip(values.values(), columns))
+    ).where(~active)
+    return insert(model).from_select(list(values), row)
+
+
+async def _kill_and_reap(proc: asyncio.subprocess.Process) -> None:
+    """Kill a subprocess if it is still running, then wait for it to exit."""
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    await proc.wait()
+
+
 class BaseAgent(ABC):
     """Base class for all swarm agents.
 
@@ -61,7 +114,17 @@ class BaseAgent(ABC):
         self.session_id = session_id or str(uuid.uuid4())
         self.agent_id = agent_id or f"agent-{self.session_id[:8]}"
         self.started_at = datetime.utcnow()
-        self.logger = structlog.get_logger(self.__module__)
+        # Bound once so every agent log line carries its identity without
+        # rebuilding those fields per call
+        self.logger = structlog.get_logger(self.__module__).bind(
+            agent=self.name, session_id=self.session_id
+        )
+        self.logs_dir = self.repo_root / "logs"
+        # Created on first use, then remembered, so only the first log path costs a mkdir
+        self._logs_dir_ready = False
+        # (resource_id, resource_type) pairs this agent holds, kept fresh by _heartbeat_loop
+        self._claims: set[tuple[str, str]] = set()
+        self._heartbeat_task: asyncio.Task | None = None
 
     @property
     @abstractmethod
@@ -110,6 +173,8 @@ class BaseAgent(ABC):
         """Claim a resource (task/project) to prevent other agents from working on it.
 
         This checks the Master Work Queue to ensure the work item is assigned to THIS agent.
+        A claim whose holder has stopped heartbeating for CLAIM_STALE_AFTER is
+        taken over, so a crashed agent doesn't hold its work forever.
 
         Args:
             resource_id: ID of the resource (e.g. Task GID)
@@ -118,53 +183,131 @@ class BaseAgent(ABC):
         Returns:
             True if claimed successfully (or already assigned to self), False otherwise.
         """
+        # Deferred so importing the agents (and the dispatcher) doesn't pull in SQLAlchemy
+        from sqlalchemy import and_, or_, update
+
+        from aegis.database.master_models import WorkQueueItem
+        from aegis.database.session import get_db_session
+
         self.logger.info("claiming_resource", resource_id=resource_id, agent_id=self.agent_id)
 
         with get_db_session(project_gid=None) as session: # Connect to Master DB
-            # Check if there is a work item for this resource
-            work_item = session.query(WorkQueueItem).filter(
-                WorkQueueItem.resource_id == resource_id,
-                WorkQueueItem.resource_type == resource_type,
-                WorkQueueItem.status.in_(["pending", "assigned"])
-            ).first()
-
-            if not work_item:
-                # If no work item exists, we can create one and assign it to self?
-                # Or we assume work items must exist.
-                # For now, let's allow ad-hoc claiming if no work item exists (e.g. CLI run)
-                self.logger.info("no_work_item_found_creating_ad_hoc", resource_id=resource_id)
-                work_item = WorkQueueItem(
-                    agent_type=self.name, # Use agent name as type?
-                    resource_id=resource_id,
-                    resource_type=resource_type,
+            # Claim a pending work item (or confirm our own claim) in one atomic
+            # UPDATE, so two agents can't both pass a read and claim the same item
+            claimed = session.execute(
+                update(WorkQueueItem)
+                .where(
+                    WorkQueueItem.resource_id == resource_id,
+                    WorkQueueItem.resource_type == resource_type,
+                    # Spelled out so all three idx_queue_resource_status columns are searched
+                    WorkQueueItem.status.in_(["pending", "assigned"]),
+                    or_(
+                        WorkQueueItem.status == "pending",
+                        and_(
+                            WorkQueueItem.status == "assigned",
+                            or_(
+                                WorkQueueItem.assigned_to_agent_id == self.agent_id,
+                                WorkQueueItem.heartbeat_at < datetime.utcnow() - CLAIM_STALE_AFTER,
+                            ),
+                        ),
+                    ),
+                )
+                .values(
                     status="assigned",
                     assigned_to_agent_id=self.agent_id,
                     assigned_at=datetime.utcnow(),
-                    priority=10
+                    heartbeat_at=datetime.utcnow(),
                 )
-                session.add(work_item)
+            )
+            if claimed.rowcount:
                 session.commit()
+                self._hold_claims([(resource_id, resource_type)])
                 return True
 
-            if work_item.assigned_to_agent_id == self.agent_id:
-                return True
-
-            if work_item.status == "pending":
-                # Claim it
-                work_item.status = "assigned"
-                work_item.assigned_to_agent_id = self.agent_id
-                work_item.assigned_at = datetime.utcnow()
-                session.commit()
+            # No claimable item. Allow ad-hoc claiming if no active work item
+            # exists at all (e.g. CLI run); the insert is skipped if one does.
+            inserted = session.execute(
+                _insert_if_no_active_work(
+                    WorkQueueItem,
+                    resource_id,
+                    resource_type,
+                    agent_type=self.name,
+                    status="assigned",
+                    assigned_to_agent_id=self.agent_id,
+                    assigned_at=datetime.utcnow(),
+                    heartbeat_at=datetime.utcnow(),
+                    priority=10,
+                    payload={},
+                )
+            )
+            session.commit()
+            if inserted.rowcount:
+                self.logger.info("no_work_item_found_creating_ad_hoc", resource_id=resource_id)
+                self._hold_claims([(resource_id, resource_type)])
                 return True
 
             # Already assigned to someone else
             self.logger.warning(
                 "resource_already_assigned",
                 resource_id=resource_id,
-                assigned_to=work_item.assigned_to_agent_id
+                assigned_to=session.query(WorkQueueItem.assigned_to_agent_id).filter(
+                    WorkQueueItem.resource_id == resource_id,
+                    WorkQueueItem.resource_type == resource_type,
+                    WorkQueueItem.status == "assigned",
+                ).scalar()
             )
             return False
 
+    async def claim_batch(self, agent_type: str, limit: int = 10) -> list:
+        """Claim up to `limit` pending work items for this agent in one statement.
+
+        Items are taken highest priority first, oldest first within a priority.
+
+        Args:
+            agent_type: Type of agent the work is queued for (e.g. 'TriageAgent')
+            limit: Maximum number of items to claim
+
+        Returns:
+            Claimed WorkQueueItems (detached from the session), in claim order
+        """
+        from sqlalchemy import select, update
+
+        from aegis.database.master_models import WorkQueueItem
+        from aegis.database.session import get_db_session
+
+        with get_db_session(project_gid=None) as session:
+            # SKIP LOCKED lets concurrent agents dequeue disjoint items on
+            # Postgres; SQLite ignores it and serializes the UPDATE instead
+            next_ids = (
+                select(WorkQueueItem.id)
+                .where(
+                    WorkQueueItem.agent_type == agent_type,
+                    WorkQueueItem.status == "pending",
+                )
+                .order_by(WorkQueueItem.priority.desc(), WorkQueueItem.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            items = session.scalars(
+                update(WorkQueueItem)
+                .where(WorkQueueItem.id.in_(next_ids))
+                .values(
+                    status="assigned",
+                    assigned_to_agent_id=self.agent_id,
+                    assigned_at=datetime.utcnow(),
+                    heartbeat_at=datetime.utcnow(),
+                )
+                .returning(WorkQueueItem)
+            ).all()
+            # Detach before the commit so the returned items stay readable
+            session.expunge_all()
+
+        # RETURNING doesn't guarantee row order
+        items.sort(key=lambda item: (-item.priority, item.id))
+        self._hold_claims((item.resource_id, item.resource_type) for item in items)
+        self.logger.info("claimed_batch", agent_type=agent_type, count=len(items))
+        return items
+
     async def release_resource(self, resource_id: str, resource_type: str, success: bool = True) -> None:
         """Release a claimed resource.
 
@@ -173,18 +316,72 @@ class BaseAgent(ABC):
             resource_type: 'task' or 'project'
             success: Whether the work was completed successfully
         """
+        from sqlalchemy import update
+
+        from aegis.database.master_models import WorkQueueItem
+        from aegis.database.session import get_db_session
+
         self.logger.info("releasing_resource", resource_id=resource_id, success=success)
 
         with get_db_session(project_gid=None) as session:
-            work_item = session.query(WorkQueueItem).filter(
-                WorkQueueItem.resource_id == resource_id,
-                WorkQueueItem.resource_type == resource_type,
-                WorkQueueItem.assigned_to_agent_id == self.agent_id
-            ).first()
-
-            if work_item:
-                work_item.status = "completed" if success else "failed"
-                session.commit()
+            # Update in place rather than loading the ORM object just to set its status
+            session.execute(
+                update(WorkQueueItem)
+                .where(
+                    WorkQueueItem.resource_id == resource_id,
+                    WorkQueueItem.resource_type == resource_type,
+                    WorkQueueItem.assigned_to_agent_id == self.agent_id,
+                    WorkQueueItem.status == "assigned",
+                )
+                .values(status="completed" if success else "failed")
+            )
+            session.commit()
+
+        self._claims.discard((resource_id, resource_type))
+        if not self._claims and self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def heartbeat_claims(self) -> int:
+        """Refresh heartbeat_at on every work item this agent has claimed.
+
+        Keeps the claims from being taken over as stale (see CLAIM_STALE_AFTER).
+
+        Returns:
+            Number of work items refreshed
+        """
+        from sqlalchemy import update
+
+        from aegis.database.master_models import WorkQueueItem
+        from aegis.database.session import get_db_session
+
+        with get_db_session(project_gid=None) as session:
+            refreshed = session.execute(
+                update(WorkQueueItem)
+                .where(
+                    WorkQueueItem.assigned_to_agent_id == self.agent_id,
+                    WorkQueueItem.status == "assigned",
+                    WorkQueueItem.heartbeat_at.is_not(None),
+                )
+                .values(heartbeat_at=datetime.utcnow())
+            )
+            session.commit()
+            return refreshed.rowcount
+
+    def _hold_claims(self, claims) -> None:
+        """Record claims and make sure the heartbeat loop is running."""
+        self._claims.update(claims)
+        if self._claims and (self._heartbeat_task is None or self._heartbeat_task.done()):
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self) -> None:
+        """Heartbeat this agent's claims until it has released them all."""
+        while self._claims:
+            await asyncio.sleep(CLAIM_HEARTBEAT_SECONDS)
+            try:
+                await self.heartbeat_claims()
+            except Exception as e:
+                self.logger.warning("claim_heartbeat_failed", error=str(e))
 
     async def add_work_to_queue(
         self,
@@ -203,31 +400,29 @@ class BaseAgent(ABC):
             priority: Priority level (higher is more urgent)
             payload: Optional context data
         """
+        from aegis.database.master_models import WorkQueueItem
+        from aegis.database.session import get_db_session
+
         self.logger.info("adding_work_to_queue", agent_type=agent_type, resource_id=resource_id)
 
         with get_db_session(project_gid=None) as session:
-            # Check if already exists
-            existing = session.query(WorkQueueItem).filter(
-                WorkQueueItem.resource_id == resource_id,
-                WorkQueueItem.resource_type == resource_type,
-                WorkQueueItem.status.in_(["pending", "assigned"])
-            ).first()
-
-            if existing:
-                self.logger.info("work_already_exists", resource_id=resource_id)
-                return
-
-            work_item = WorkQueueItem(
-                agent_type=agent_type,
-                resource_id=resource_id,
-                resource_type=resource_type,
-                priority=priority,
-                payload=payload or {},
-                status="pending"
+            # Insert only if no active item exists for the resource, in one statement
+            inserted = session.execute(
+                _insert_if_no_active_work(
+                    WorkQueueItem,
+                    resource_id,
+                    resource_type,
+                    agent_type=agent_type,
+                    priority=priority,
+                    payload=payload or {},
+                    status="pending",
+                )
             )
-            session.add(work_item)
             session.commit()
 
+            if not inserted.rowcount:
+                self.logger.info("work_already_exists", resource_id=resource_id)
+
     async def run_claude_code(
         self,
         prompt: str,
@@ -236,6 +431,7 @@ class BaseAgent(ABC):
         interactive: bool = False,
         log_path: Path | str | None = None,
         project_name: str | None = None,
+        tail_lines: int | None = None,
     ) -> tuple[str, str, int]:
         """Run Claude Code CLI with prompt.
 
@@ -246,6 +442,8 @@ class BaseAgent(ABC):
             interactive: Whether to run in interactive mode (inherit stdio)
             log_path: Path to session log file
             project_name: Name of the project
+            tail_lines: If set, only keep the last this-many lines of stdout in
+                memory (the session log, if any, still gets all of it)
 
         Returns:
             Tuple of (stdout, stderr, returncode)
@@ -255,27 +453,26 @@ class BaseAgent(ABC):
         """
         cwd = cwd or self.repo_root
 
-        log_kwargs = {
-            "agent": self.name,
-            "session_id": self.session_id,
-            "cwd": str(cwd),
-            "interactive": interactive,
-        }
+        log_kwargs = {}
         if log_path:
             log_kwargs["session_log_path"] = str(log_path)
         if project_name:
             log_kwargs["project"] = project_name
 
-        self.logger.info("running_claude_code", **log_kwargs)
+        self.logger.info("running_claude_code", cwd=str(cwd), interactive=interactive, **log_kwargs)
         if log_path:
             print(f"session_log_path= {log_path}")
 
+        # Headless runs use asyncio subprocesses; the interactive run needs
+        # inherited stdio, so it stays on subprocess.run in a worker thread.
+        # Either way the event loop (and other agents' coroutines) stays responsive.
         try:
             if interactive:
                 # Run interactively - inherit stdio
                 # Note: timeout is ignored in interactive mode as it depends on user input
                 # Pass prompt as argument since we can't pipe stdin in interactive mode
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["claude", "code", prompt],
                     cwd=cwd,
                     check=False,  # Don't raise on non-zero exit
@@ -283,24 +480,41 @@ class BaseAgent(ABC):
                 stdout, stderr = "", ""
                 returncode = result.returncode
 
+            elif log_path or tail_lines:
+                # Run headless, streaming output into the session log as it
+                # arrives so the log can be tailed while Claude Code runs
+                stdout, stderr, returncode = await self._stream_claude_code(
+                    prompt, cwd, timeout, Path(log_path) if log_path else None, tail_lines
+                )
+
             else:
                 # Run headless - capture output
                 # Pass prompt via stdin and use -p for print mode
-                result = subprocess.run(
-                    ["claude", "code", "-p"],
-                    input=prompt,
+                cmd = ["claude", "code", "-p"]
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
                     cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                 )
-                stdout, stderr = result.stdout, result.stderr
-                returncode = result.returncode
+                try:
+                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                        proc.communicate(prompt.encode()), timeout
+                    )
+                except asyncio.TimeoutError:
+                    await _kill_and_reap(proc)
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                except BaseException:
+                    # Don't leave Claude Code running on errors or cancellation
+                    await _kill_and_reap(proc)
+                    raise
+                stdout = stdout_bytes.decode(errors="replace")
+                stderr = stderr_bytes.decode(errors="replace")
+                returncode = proc.returncode
 
             self.logger.info(
                 "claude_code_complete",
-                agent=self.name,
-                session_id=self.session_id,
                 returncode=returncode,
                 stdout_size=len(stdout),
             )
@@ -310,20 +524,94 @@ class BaseAgent(ABC):
         except subprocess.TimeoutExpired as e:
             self.logger.error(
                 "claude_code_timeout",
-                agent=self.name,
-                session_id=self.session_id,
                 timeout=timeout,
             )
             raise AgentError(f"Claude Code timeout after {timeout}s")
         except Exception as e:
             self.logger.error(
                 "claude_code_error",
-                agent=self.name,
-                session_id=self.session_id,
                 error=str(e),
             )
             raise AgentError(f"Claude Code execution failed: {e}")
 
+    async def _stream_claude_code(
+        self,
+        prompt: str,
+        cwd: Path,
+        timeout: int,
+        log_path: Path | None,
+        tail_lines: int | None = None,
+    ) -> tuple[str, str, int]:
+        """Run Claude Code headless, reading stdout incrementally as it arrives.
+
+        Args:
+            prompt: Prompt to send to Claude Code on stdin
+            cwd: Working directory
+            timeout: Timeout in seconds
+            log_path: Session log file to copy stdout into, if any
+            tail_lines: If set, only the last this-many lines of stdout are kept
+
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+
+        Raises:
+            subprocess.TimeoutExpired: If Claude Code doesn't exit within timeout
+        """
+        cmd = ["claude", "code", "-p"]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Newline-terminated lines, bounded by tail_lines; partial holds the unterminated rest
+        lines: deque[bytes] = deque(maxlen=tail_lines)
+        partial = b""
+
+        async def feed_stdin() -> None:
+            try:
+                proc.stdin.write(prompt.encode())
+                await proc.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                # Exited without reading all of the prompt; its exit status says why
+                pass
+            finally:
+                proc.stdin.close()
+
+        async def pump_stdout() -> None:
+            nonlocal partial
+            log_fh = open(log_path, "wb") if log_path else None
+            try:
+                # Read fixed-size chunks rather than lines: output may contain very long lines
+                while chunk := await proc.stdout.read(65536):
+                    if log_fh:
+                        log_fh.write(chunk)
+                        log_fh.flush()
+                    *complete, partial = (partial + chunk).split(b"\n")
+                    lines.extend(line + b"\n" for line in complete)
+            finally:
+                if log_fh:
+                    log_fh.close()
+
+        try:
+            _, _, stderr_bytes, returncode = await asyncio.wait_for(
+                asyncio.gather(feed_stdin(), pump_stdout(), proc.stderr.read(), proc.wait()),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            await _kill_and_reap(proc)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except BaseException:
+            # Don't leave Claude Code running on errors or cancellation
+            await _kill_and_reap(proc)
+            raise
+
+        if partial:
+            lines.append(partial)
+        stdout = b"".join(lines).decode(errors="replace")
+        return stdout, stderr_bytes.decode(errors="replace"), returncode
+
     async def post_result_comment(
         self,
         target: AsanaTask | AsanaProject,
@@ -369,7 +657,6 @@ class BaseAgent(ABC):
         if current_cost >= max_cost:
             self.logger.warning(
                 "cost_limit_exceeded",
-                agent=self.name,
                 target=format_asana_resource(target),
                 current_cost=current_cost,
                 max_cost=max_cost,
@@ -387,8 +674,9 @@ class BaseAgent(ABC):
         Returns:
             Path to log file
         """
-        logs_dir = self.repo_root / "logs"
-        logs_dir.mkdir(exist_ok=True)
+        if not self._logs_dir_ready:
+            self.logs_dir.mkdir(exist_ok=True)
+            self._logs_dir_ready = True
 
-        return logs_dir / f"session-{self.session_id}-target-{target.gid}.log"
+        return self.logs_dir / f"session-{self.session_id}-target-{target.gid}.log"
 
@@ -1,8 +1,35 @@
 """Consolidator Agent - Scans for code duplication."""
 
-from aegis.agents.base import BaseAgent, AgentResult, AgentTargetType
+import textwrap
+
+from aegis.agents.base import CLAUDE_OUTPUT_TAIL_LINES, BaseAgent, AgentResult, AgentTargetType
 from aegis.asana.models import AsanaTask, AsanaProject
 
+_CONSOLIDATOR_PROMPT = textwrap.dedent("""\
+    You are an expert software engineer specializing in DRY (Don't Repeat Yourself) principles.
+
+    Your task is to scan the codebase for duplicated code or logic.
+    Focus on:
+    1. Similar functions or classes in different files.
+    2. Repeated configuration or setup logic.
+    3. Copy-pasted code blocks.
+
+    For each opportunity found, you must:
+    1. Identify the duplicated locations.
+    2. Propose a shared abstraction or utility.
+    3. Estimate the effort (Low/Medium/High).
+
+    If you find significant issues, create a NEW TASK for each one in the 'Proposals' section.
+
+    PROPOSAL:
+    Title: Consolidate [Functionality]: [Brief Description]
+    Description:
+    [Detailed description of duplication and proposed fix]
+
+    Effort: [Effort]
+""")
+
+
 class ConsolidatorAgent(BaseAgent):
     """Agent that scans codebase for duplication and consolidation opportunities."""
 
@@ -21,29 +48,7 @@ class ConsolidatorAgent(BaseAgent):
 
     def get_prompt(self, target: AsanaTask | AsanaProject) -> str:
         """Generate prompt for consolidation analysis."""
-        return """
-        You are an expert software engineer specializing in DRY (Don't Repeat Yourself) principles.
-
-        Your task is to scan the codebase for duplicated code or logic.
-        Focus on:
-        1. Similar functions or classes in different files.
-        2. Repeated configuration or setup logic.
-        3. Copy-pasted code blocks.
-
-        For each opportunity found, you must:
-        1. Identify the duplicated locations.
-        2. Propose a shared abstraction or utility.
-        3. Estimate the effort (Low/Medium/High).
-
-        If you find significant issues, create a NEW TASK for each one in the 'Proposals' section.
-
-        PROPOSAL:
-        Title: Consolidate [Functionality]: [Brief Description]
-        Description:
-        [Detailed description of duplication and proposed fix]
-
-        Effort: [Effort]
-        """
+        return _CONSOLIDATOR_PROMPT
 
     async def execute(self, target: AsanaTask | AsanaProject, **kwargs) -> AgentResult:
         """Execute consolidation analysis."""
@@ -52,7 +57,10 @@ class ConsolidatorAgent(BaseAgent):
 
         prompt = self.get_prompt(target)
 
-        stdout, stderr, returncode = await self.run_claude_code(prompt)
+        # Only the exit status is used, so don't hold the whole output in memory
+        stdout, stderr, returncode = await self.run_claude_code(
+            prompt, tail_lines=CLAUDE_OUTPUT_TAIL_LINES
+        )
 
         if returncode != 0:
             return AgentResult(
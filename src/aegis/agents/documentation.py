@@ -1,16 +1,16 @@
 """Documentation Agent - The Librarian."""
 
-from pathlib import Path
-
 import structlog
 
-from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType
+from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType, PROMPTS_DIR
 from aegis.asana.models import AsanaTask, AsanaProject
 from aegis.infrastructure.memory_manager import MemoryManager
 from aegis.utils.asana_utils import format_asana_resource
 
 logger = structlog.get_logger(__name__)
 
+PROMPT_FILE = PROMPTS_DIR / "documentation.prompt.txt"
+
 
 class DocumentationAgent(BaseAgent):
     """Documentation Agent maintains institutional knowledge.
@@ -55,7 +55,7 @@ class DocumentationAgent(BaseAgent):
         Returns:
             Prompt text
         """
-        prompt_file = Path(__file__).parent.parent.parent.parent / "prompts" / "documentation.prompt.txt"
+        prompt_file = PROMPT_FILE
 
         if not prompt_file.exists():
             logger.warning("documentation_prompt_not_found", prompt_file=str(prompt_file))
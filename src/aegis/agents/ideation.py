@@ -1,6 +1,6 @@
 """Ideation Agent - Suggests new features."""
 
-from aegis.agents.base import BaseAgent, AgentResult, AgentTargetType
+from aegis.agents.base import CLAUDE_OUTPUT_TAIL_LINES, BaseAgent, AgentResult, AgentTargetType
 from aegis.asana.models import AsanaTask, AsanaProject
 
 class IdeationAgent(BaseAgent):
@@ -53,7 +53,9 @@ class IdeationAgent(BaseAgent):
         stdout, stderr, returncode = await self.run_claude_code(
             prompt,
             log_path=log_path,
-            project_name=project_name
+            project_name=project_name,
+            # Proposals are read from the session log; only keep a tail in memory
+            tail_lines=CLAUDE_OUTPUT_TAIL_LINES,
         )
 
         if returncode != 0:
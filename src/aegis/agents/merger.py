@@ -1,17 +1,19 @@
 """Merger Agent - The Integrator."""
 
+import asyncio
 import subprocess
-from pathlib import Path
 
 import structlog
 
-from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType
+from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType, PROMPTS_DIR
 from aegis.asana.models import AsanaTask, AsanaProject
 from aegis.infrastructure.worktree_manager import WorktreeManager
 from aegis.utils.asana_utils import format_asana_resource
 
 logger = structlog.get_logger(__name__)
 
+PROMPT_FILE = PROMPTS_DIR / "merger.prompt.txt"
+
 
 class MergerAgent(BaseAgent):
     """Merger Agent safely integrates code into main branch.
@@ -58,7 +60,7 @@ class MergerAgent(BaseAgent):
         Returns:
             Prompt text
         """
-        prompt_file = Path(__file__).parent.parent.parent.parent / "prompts" / "merger.prompt.txt"
+        prompt_file = PROMPT_FILE
 
         if not prompt_file.exists():
             logger.warning("merger_prompt_not_found", prompt_file=str(prompt_file))
@@ -245,7 +247,8 @@ NEVER skip steps or force anything.
 
         try:
             # Fetch latest
-            subprocess.run(
+            await asyncio.to_thread(
+                subprocess.run,
                 ["git", "fetch", "origin", "main", branch_name],
                 cwd=self.merger_worktree,
                 check=True,
@@ -253,7 +256,8 @@ NEVER skip steps or force anything.
             )
 
             # Merge with no-ff
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["git", "merge", "--no-ff", branch_name, "-m", f"Merge {branch_name}: {task.name}"],
                 cwd=self.merger_worktree,
                 capture_output=True,
@@ -264,7 +268,8 @@ NEVER skip steps or force anything.
             if result.returncode != 0:
                 if "CONFLICT" in result.stdout or "CONFLICT" in result.stderr:
                     # Abort merge
-                    subprocess.run(
+                    await asyncio.to_thread(
+                        subprocess.run,
                         ["git", "merge", "--abort"],
                         cwd=self.merger_worktree,
                         capture_output=True,
@@ -274,17 +279,20 @@ NEVER skip steps or force anything.
                     raise Exception(f"Merge failed: {result.stderr}")
 
             # Get merge commit hash
-            merge_commit = subprocess.run(
+            rev_parse = await asyncio.to_thread(
+                subprocess.run,
                 ["git", "rev-parse", "HEAD"],
                 cwd=self.merger_worktree,
                 capture_output=True,
                 text=True,
                 check=True,
-            ).stdout.strip()
+            )
+            merge_commit = rev_parse.stdout.strip()
 
             # Run tests
             logger.info("running_post_merge_tests", task=format_asana_resource(task))
-            test_result = subprocess.run(
+            test_result = await asyncio.to_thread(
+                subprocess.run,
                 ["pytest", "tests/", "-v"],
                 cwd=self.merger_worktree,
                 capture_output=True,
@@ -294,7 +302,8 @@ NEVER skip steps or force anything.
 
             if test_result.returncode != 0:
                 # Tests failed - abort merge
-                subprocess.run(
+                await asyncio.to_thread(
+                    subprocess.run,
                     ["git", "reset", "--hard", "origin/main"],
                     cwd=self.merger_worktree,
                     check=True,
@@ -306,7 +315,8 @@ NEVER skip steps or force anything.
 
             # Push to main
             logger.info("pushing_to_main", task=format_asana_resource(task))
-            subprocess.run(
+            await asyncio.to_thread(
+                subprocess.run,
                 ["git", "push", "origin", "main"],
                 cwd=self.merger_worktree,
                 check=True,
@@ -315,7 +325,8 @@ NEVER skip steps or force anything.
 
             # Delete remote branch
             logger.info("deleting_remote_branch", branch=branch_name)
-            subprocess.run(
+            await asyncio.to_thread(
+                subprocess.run,
                 ["git", "push", "origin", "--delete", branch_name],
                 cwd=self.merger_worktree,
                 capture_output=True,  # Don't fail if branch already deleted
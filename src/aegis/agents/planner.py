@@ -1,15 +1,15 @@
 """Planner Agent - The Architect."""
 
-from pathlib import Path
-
 import structlog
 
-from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType
+from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType, PROMPTS_DIR
 from aegis.asana.models import AsanaTask, AsanaProject
 from aegis.utils.asana_utils import format_asana_resource
 
 logger = structlog.get_logger(__name__)
 
+PROMPT_FILE = PROMPTS_DIR / "planner.prompt.txt"
+
 
 class PlannerAgent(BaseAgent):
     """Planner Agent designs implementation architecture.
@@ -46,7 +46,7 @@ class PlannerAgent(BaseAgent):
         Returns:
             Prompt text
         """
-        prompt_file = Path(__file__).parent.parent.parent.parent / "prompts" / "planner.prompt.txt"
+        prompt_file = PROMPT_FILE
 
         if not prompt_file.exists():
             logger.warning("planner_prompt_not_found", prompt_file=str(prompt_file))
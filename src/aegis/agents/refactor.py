@@ -1,8 +1,40 @@
 """Refactor Agent - Scans for refactoring opportunities."""
 
-from aegis.agents.base import BaseAgent, AgentResult, AgentTargetType
+import textwrap
+
+from aegis.agents.base import CLAUDE_OUTPUT_TAIL_LINES, BaseAgent, AgentResult, AgentTargetType
 from aegis.asana.models import AsanaTask, AsanaProject
 
+_REFACTOR_PROMPT = textwrap.dedent("""\
+    You are an expert software architect specializing in code quality and refactoring.
+
+    Your task is to scan the codebase for areas that need refactoring.
+    Focus on:
+    1. Complex functions or classes that violate Single Responsibility Principle.
+    2. Legacy code patterns that should be updated.
+    3. Poorly named variables or functions.
+    4. Lack of type hints or documentation.
+    5. Performance bottlenecks.
+
+    For each opportunity found, you must:
+    1. Describe the issue clearly.
+    2. Propose a specific refactoring plan.
+    3. Estimate the effort (Low/Medium/High).
+
+    If you find significant issues, create a NEW TASK for each one in the 'Proposals' section.
+    Use the `asana_create_task` tool if available, or output a structured JSON list of tasks to create.
+
+    Since I cannot directly create tasks yet, please output the proposals in this format:
+
+    PROPOSAL:
+    Title: Refactor [Component]: [Brief Description]
+    Description:
+    [Detailed description of the issue and proposed fix]
+
+    Effort: [Effort]
+""")
+
+
 class RefactorAgent(BaseAgent):
     """Agent that scans codebase for refactoring opportunities."""
 
@@ -21,34 +53,7 @@ class RefactorAgent(BaseAgent):
 
     def get_prompt(self, target: AsanaTask | AsanaProject) -> str:
         """Generate prompt for refactoring analysis."""
-        return """
-        You are an expert software architect specializing in code quality and refactoring.
-
-        Your task is to scan the codebase for areas that need refactoring.
-        Focus on:
-        1. Complex functions or classes that violate Single Responsibility Principle.
-        2. Legacy code patterns that should be updated.
-        3. Poorly named variables or functions.
-        4. Lack of type hints or documentation.
-        5. Performance bottlenecks.
-
-        For each opportunity found, you must:
-        1. Describe the issue clearly.
-        2. Propose a specific refactoring plan.
-        3. Estimate the effort (Low/Medium/High).
-
-        If you find significant issues, create a NEW TASK for each one in the 'Proposals' section.
-        Use the `asana_create_task` tool if available, or output a structured JSON list of tasks to create.
-
-        Since I cannot directly create tasks yet, please output the proposals in this format:
-
-        PROPOSAL:
-        Title: Refactor [Component]: [Brief Description]
-        Description:
-        [Detailed description of the issue and proposed fix]
-
-        Effort: [Effort]
-        """
+        return _REFACTOR_PROMPT
 
     async def execute(self, target: AsanaTask | AsanaProject, **kwargs) -> AgentResult:
         """Execute refactor analysis."""
@@ -60,7 +65,10 @@ class RefactorAgent(BaseAgent):
 
         prompt = self.get_prompt(target)
 
-        stdout, stderr, returncode = await self.run_claude_code(prompt)
+        # Only the exit status is used, so don't hold the whole output in memory
+        stdout, stderr, returncode = await self.run_claude_code(
+            prompt, tail_lines=CLAUDE_OUTPUT_TAIL_LINES
+        )
 
         if returncode != 0:
             return AgentResult(
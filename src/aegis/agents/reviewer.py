@@ -1,17 +1,20 @@
 """Reviewer Agent - The Gatekeeper."""
 
+import asyncio
 import subprocess
 from pathlib import Path
 
 import structlog
 
-from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType
+from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType, PROMPTS_DIR
 from aegis.asana.models import AsanaTask, AsanaProject
 from aegis.infrastructure.worktree_manager import WorktreeManager
 from aegis.utils.asana_utils import format_asana_resource
 
 logger = structlog.get_logger(__name__)
 
+PROMPT_FILE = PROMPTS_DIR / "reviewer.prompt.txt"
+
 
 class ReviewerAgent(BaseAgent):
     """Reviewer Agent verifies code quality before merge.
@@ -56,7 +59,7 @@ class ReviewerAgent(BaseAgent):
         Returns:
             Prompt text
         """
-        prompt_file = Path(__file__).parent.parent.parent.parent / "prompts" / "reviewer.prompt.txt"
+        prompt_file = PROMPT_FILE
 
         if not prompt_file.exists():
             logger.warning("reviewer_prompt_not_found", prompt_file=str(prompt_file))
@@ -217,7 +220,8 @@ Run all tests and verify quality standards.
         try:
             logger.info("running_tests", task_gid=task_gid, worktree_path=str(worktree_path))
 
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["pytest", "tests/", "-v", "--tb=short"],
                 cwd=worktree_path,
                 capture_output=True,
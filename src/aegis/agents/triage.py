@@ -1,17 +1,18 @@
 """Triage Agent - Requirements Analyst."""
 
 import re
-from pathlib import Path
 
 import structlog
 
-from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType
+from aegis.agents.base import AgentResult, BaseAgent, AgentTargetType, PROMPTS_DIR
 from aegis.asana.models import AsanaTask, AsanaProject
 from aegis.infrastructure.asana_service import AsanaService
 from aegis.utils.asana_utils import format_asana_resource
 
 logger = structlog.get_logger(__name__)
 
+PROMPT_FILE = PROMPTS_DIR / "triage.prompt.txt"
+
 
 class TriageAgent(BaseAgent):
     """Triage Agent analyzes tasks and routes them appropriately.
@@ -47,7 +48,7 @@ class TriageAgent(BaseAgent):
         Returns:
             Prompt text
         """
-        prompt_file = Path(__file__).parent.parent.parent.parent / "prompts" / "triage.prompt.txt"
+        prompt_file = PROMPT_FILE
 
         if not prompt_file.exists():
             logger.warning("triage_prompt_not_found", prompt_file=str(prompt_file))
@@ -1,5 +1,6 @@
 """Worker Agent - The Builder."""
 
+import asyncio
 import subprocess
 from pathlib import Path
 
@@ -228,7 +229,8 @@ Follow the plan step-by-step. Test as you go. Remember to rebase on main before
         """
         try:
             # Fetch latest main
-            subprocess.run(
+            await asyncio.to_thread(
+                subprocess.run,
                 ["git", "fetch", "origin", "main"],
                 cwd=worktree_path,
                 check=True,
@@ -236,7 +238,8 @@ Follow the plan step-by-step. Test as you go. Remember to rebase on main before
             )
 
             # Merge main into feature branch
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["git", "merge", "origin/main"],
                 cwd=worktree_path,
                 capture_output=True,
@@ -319,18 +322,19 @@ Follow the plan step-by-step. Test as you go. Remember to rebase on main before
 
 
 import click
-import asyncio
 from aegis.config import get_settings
 from aegis.asana.client import AsanaClient
 from aegis.infrastructure.asana_service import AsanaService
-from aegis.database.session import get_db_session
-from aegis.database.master_models import WorkQueueItem, AgentState
 from datetime import datetime
 
 @click.command()
 @click.option("--agent-id", required=True, help="Unique ID for this agent instance")
 def main(agent_id: str):
     """Run the Worker Agent process."""
+    # Deferred so importing WorkerAgent doesn't pull in SQLAlchemy
+    from aegis.database.master_models import AgentState, WorkQueueItem
+    from aegis.database.session import get_db_session
+
     # Setup logging
     logging_config = {
         "version": 1,
@@ -1,12 +1,18 @@
 """Asana API client wrapper."""
 
 import asyncio
+import functools
+import itertools
+import time
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import asana
+import orjson
 import structlog
+import urllib3
 from asana.rest import ApiException
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from aegis.asana.models import (
     AsanaComment,
@@ -19,20 +25,153 @@ from aegis.asana.models import (
 
 logger = structlog.get_logger()
 
+# Asana's Batch API accepts at most this many actions per request
+BATCH_ACTION_LIMIT = 10
+
+
+class AsanaBatchError(Exception):
+    """Raised when actions sent through a save session fail."""
+
+    def __init__(self, failures: list[tuple[dict[str, Any], dict[str, Any]]]) -> None:
+        """Initialize batch error.
+
+        Args:
+            failures: (action, response) pairs for each failed action
+        """
+        self.failures = failures
+        details = ", ".join(
+            f"{action['method'].upper()} {action['relative_path']} -> {response.get('status_code')}"
+            for action, response in failures
+        )
+        super().__init__(f"{len(failures)} batch action(s) failed: {details}")
+
+
+def is_batch_success(response: dict[str, Any]) -> bool:
+    """Check whether a Batch API action response has a 2xx status."""
+    return 200 <= (response.get("status_code") or 0) < 300
+
+
+def _batch_error_response(error: Exception) -> dict[str, Any]:
+    """Build the response entry for an action whose batch request failed."""
+    return {
+        "status_code": getattr(error, "status", None),
+        "headers": {},
+        "body": {"errors": [{"message": str(error)}]},
+    }
+
+# Task fields fetched when a caller doesn't narrow them
+TASK_OPT_FIELDS = ",".join([
+    "name",
+    "notes",
+    "html_notes",
+    "completed",
+    "completed_at",
+    "created_at",
+    "modified_at",
+    "due_on",
+    "due_at",
+    "assignee.name",
+    "assignee.email",
+    "assignee_status",
+    "projects.name",
+    "tags.name",
+    "parent.name",
+    "num_subtasks",
+    "permalink_url",
+])
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Check whether an Asana call failure is transient and worth retrying.
+
+    Rate limits (429), server errors (5xx) and transport failures are retried.
+    Client errors such as 400/401/403/404 are permanent and fail immediately.
+
+    Args:
+        exc: Exception raised by the Asana SDK
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(exc, ApiException):
+        status = exc.status
+        if not status:
+            # No HTTP response (connection/SSL failure)
+            return True
+        return isinstance(status, int) and (status == 429 or status >= 500)
+    return isinstance(exc, (urllib3.exceptions.HTTPError, ConnectionError, TimeoutError))
+
+
+# Jittered backoff so concurrent callers hitting the same 429/5xx burst
+# don't all retry in lockstep.
+asana_retry = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(multiplier=0.5, max=15),
+    retry=retry_if_exception(is_retryable_error),
+    reraise=True,
+)
+
+
+class _OrjsonApiClient(asana.ApiClient):
+    """asana.ApiClient that parses JSON responses with orjson.
+
+    The SDK decodes each body to str, copies it to replace non-breaking
+    spaces, then runs json.loads; orjson parses the UTF-8 bytes directly
+    and is several times faster on large pages.
+    """
+
+    def deserialize(self, response, response_type):
+        if response_type == "file":
+            return super().deserialize(response, response_type)
+        try:
+            # Same non-breaking-space normalisation as the SDK, on the raw bytes
+            data = orjson.loads(response.data.replace(b"\xc2\xa0", b" "))
+        except (TypeError, ValueError):
+            return super().deserialize(response, response_type)
+        return self._ApiClient__deserialize(data, response_type)
+
+
+@functools.cache
+def get_asana_api_client(access_token: str, pool_maxsize: int = 20) -> asana.ApiClient:
+    """Get a shared low-level Asana API client for an access token.
+
+    Clients are cached per (token, pool size) so every caller in the process
+    reuses one urllib3 connection pool (and its keep-alive connections). The
+    pool holds at least pool_maxsize connections so concurrent to_thread calls
+    don't queue waiting for one; the SDK default (cpu_count() * 5) is kept
+    when it is larger.
+
+    Args:
+        access_token: Asana Personal Access Token
+        pool_maxsize: Minimum number of pooled HTTP connections
+
+    Returns:
+        Configured asana.ApiClient
+    """
+    configuration = asana.Configuration()
+    configuration.access_token = access_token
+    configuration.connection_pool_maxsize = max(
+        pool_maxsize, configuration.connection_pool_maxsize
+    )
+    return _OrjsonApiClient(configuration)
+
 
 class AsanaClient:
     """Wrapper around Asana API with async support and rate limiting."""
 
-    def __init__(self, access_token: str) -> None:
+    def __init__(self, access_token: str, cache_ttl: float = 0.0) -> None:
         """Initialize Asana client.
 
         Args:
             access_token: Asana Personal Access Token
+            cache_ttl: Seconds to reuse project and section lookups. Off by
+                default so long-lived clients (syncer, dispatcher) see renames
+                and section changes made elsewhere; short-lived scripts opt in.
         """
-        # Configure API client
-        configuration = asana.Configuration()
-        configuration.access_token = access_token
-        self.api_client = asana.ApiClient(configuration)
+        self.api_client = get_asana_api_client(access_token)
+        self.cache_ttl = cache_ttl
+        # (kind, project_gid, *args) -> (expires_at, value) for low-churn reads
+        self._cache: dict[tuple, tuple[float, Any]] = {}
 
         # Initialize API instances
         self.tasks_api = asana.TasksApi(self.api_client)
@@ -43,12 +182,123 @@ class AsanaClient:
         self.portfolios_api = asana.PortfoliosApi(self.api_client)
         self.custom_fields_api = asana.CustomFieldsApi(self.api_client)
         self.custom_field_settings_api = asana.CustomFieldSettingsApi(self.api_client)
+        self.batch_api = asana.BatchAPIApi(self.api_client)
+        self.teams_api = asana.TeamsApi(self.api_client)
+        self.typeahead_api = asana.TypeaheadApi(self.api_client)
+
+    def _cache_get(self, key: tuple) -> Any | None:
+        """Return a cached value if present and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        return value
+
+    def _cache_set(self, key: tuple, value: Any) -> None:
+        """Cache a value for cache_ttl seconds."""
+        if self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+
+    def invalidate_cache(self, kind: str | None = None, project_gid: str | None = None) -> None:
+        """Drop cached lookups.
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+        Args:
+            kind: Only drop this kind of entry ("project" or "sections")
+            project_gid: Only drop entries for this project
+        """
+        for key in list(self._cache):
+            if (kind is None or key[0] == kind) and (project_gid is None or key[1] == project_gid):
+                del self._cache[key]
+
+    def save_session(self) -> "AsanaSaveSession":
+        """Start a unit of work that sends queued writes as one batch.
+
+        Usage:
+            async with client.save_session() as session:
+                session.add_comment(task_gid, "Done")
+                session.mark_complete(task_gid)
+
+        Returns:
+            AsanaSaveSession bound to this client
+        """
+        return AsanaSaveSession(self)
+
+    async def batch(
+        self, actions: list[dict[str, Any]], max_concurrency: int = 1
+    ) -> list[dict[str, Any]]:
+        """Submit several API requests in as few HTTP round-trips as possible.
+
+        Uses Asana's Batch API, sending up to BATCH_ACTION_LIMIT actions per
+        request. Actions within a request run in parallel on Asana's side with
+        no ordering guarantee, so only batch independent operations.
+
+        Args:
+            actions: Batch actions, each with ``relative_path``, ``method`` and
+                optional ``data``/``options``
+            max_concurrency: Maximum number of batch requests in flight at once
+
+        Returns:
+            One response dict (``status_code``, ``headers``, ``body``) per
+            action, in the same order as ``actions``. Actions in a request
+            that failed after retries get an error entry instead.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _submit(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            async with sem:
+                return await self._submit_batch(chunk)
+
+        chunks = [
+            actions[start:start + BATCH_ACTION_LIMIT]
+            for start in range(0, len(actions), BATCH_ACTION_LIMIT)
+        ]
+        chunk_responses = await asyncio.gather(
+            *(_submit(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        responses = []
+        for chunk, result in zip(chunks, chunk_responses):
+            if isinstance(result, BaseException):
+                # A request that failed after retries fails each of its actions
+                # without discarding the results of the other requests
+                if not isinstance(result, Exception):
+                    raise result
+                result = [_batch_error_response(result)] * len(chunk)
+            responses.extend(result)
+
+        failed = 0
+        for action, response in zip(actions, responses):
+            if not is_batch_success(response):
+                failed += 1
+                logger.error(
+                    "batch_action_failed",
+                    relative_path=action["relative_path"],
+                    method=action["method"],
+                    status_code=response.get("status_code"),
+                    body=response.get("body"),
+                )
+        logger.info("submitted_batch", action_count=len(actions), failed_count=failed)
+        return responses
+
+    @asana_retry
+    async def _submit_batch(self, actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send one Batch API request of at most BATCH_ACTION_LIMIT actions."""
+        try:
+            # The SDK returns a lazy iterator; drain it in the worker thread
+            return await asyncio.to_thread(
+                lambda: list(
+                    self.batch_api.create_batch_request({"data": {"actions": actions}}, {})
+                )
+            )
+
+        except ApiException as e:
+            logger.error("asana_api_error", error=str(e), operation="batch")
+            raise
+
+    @asana_retry
     async def get_project_custom_fields(self, project_gid: str) -> list[dict]:
         """Get custom field settings for a project.
 
@@ -78,79 +328,243 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), project_gid=project_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def get_tasks_from_project(
-        self, project_gid: str, assigned_only: bool = False
+        self, project_gid: str, assigned_only: bool = False, opt_fields: str | None = None
     ) -> list[AsanaTask]:
         """Get all tasks from a project.
 
         Args:
             project_gid: The GID of the project
             assigned_only: If True, only return assigned incomplete tasks
+            opt_fields: Comma-separated fields to fetch instead of the full task
+                (must include created_at and modified_at, plus assignee and
+                completed when assigned_only is set)
 
         Returns:
             List of AsanaTask objects
         """
+        tasks = []
+        async for task_dict in self.iter_task_dicts(project_gid, opt_fields or TASK_OPT_FIELDS):
+            # Optionally filter for assigned tasks
+            if assigned_only and (
+                not task_dict.get("assignee") or task_dict.get("completed")
+            ):
+                continue
+
+            tasks.append(self._parse_task(task_dict))
+
+        logger.info(
+            "fetched_tasks_from_project",
+            project_gid=project_gid,
+            task_count=len(tasks),
+            assigned_only=assigned_only,
+        )
+        return tasks
+
+    async def iter_tasks(
+        self, project_gid: str, opt_fields: str | None = None
+    ) -> AsyncIterator[AsanaTask]:
+        """Iterate over a project's tasks, fetching pages as they are consumed.
+
+        Breaking out of the loop early (e.g. once a task is found) skips the
+        remaining page requests.
+
+        Args:
+            project_gid: The GID of the project
+            opt_fields: Comma-separated fields to fetch instead of the full task
+                (must include created_at and modified_at)
+
+        Yields:
+            AsanaTask objects
+        """
+        async for task_dict in self.iter_task_dicts(project_gid, opt_fields or TASK_OPT_FIELDS):
+            yield self._parse_task(task_dict)
+
+    async def iter_task_dicts(
+        self, project_gid: str, opt_fields: str, page_size: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over a project's tasks as raw API dicts.
+
+        Pages are fetched lazily, one worker-thread hop per page, so a caller
+        that stops early (e.g. once a task is found by name) skips the
+        remaining page requests. No AsanaTask models are built, which keeps
+        bulk scans that only compare a field or two cheap.
+
+        Args:
+            project_gid: The GID of the project
+            opt_fields: Comma-separated task fields to fetch
+            page_size: Tasks per page request (Asana caps this at 100)
+
+        Yields:
+            Task dicts as returned by the Asana API
+        """
+        # Building the SDK iterator is lazy; requests happen as it is consumed
+        tasks_iter = self.tasks_api.get_tasks_for_project(
+            project_gid, {"opt_fields": opt_fields, "limit": page_size}
+        )
+
         try:
-            opt_fields = [
-                "name",
-                "notes",
-                "html_notes",
-                "completed",
-                "completed_at",
-                "created_at",
-                "modified_at",
-                "due_on",
-                "due_at",
-                "assignee.name",
-                "assignee.email",
-                "assignee_status",
-                "projects.name",
-                "tags.name",
-                "parent.name",
-                "num_subtasks",
-                "permalink_url",
-            ]
+            async for task_dict in self._iter_pages(tasks_iter, page_size):
+                yield task_dict
+
+        except ApiException as e:
+            logger.error("asana_api_error", error=str(e), project_gid=project_gid)
+            raise
+
+    async def iter_projects(
+        self,
+        workspace_gid: str,
+        opt_fields: str = "name,gid,archived",
+        archived: bool | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over a workspace's projects as raw API dicts.
+
+        Pages are fetched as they are consumed, so only one page is held in
+        memory and the first results are available after the first request.
+
+        Args:
+            workspace_gid: The GID of the workspace
+            opt_fields: Comma-separated project fields to fetch
+            archived: Only return projects with this archived state (None for all)
+            page_size: Projects per page request (Asana caps this at 100)
+
+        Yields:
+            Project dicts as returned by the Asana API
+        """
+        opts = {"workspace": workspace_gid, "opt_fields": opt_fields, "limit": page_size}
+        if archived is not None:
+            opts["archived"] = archived
+
+        try:
+            async for project_dict in self._iter_pages(
+                self.projects_api.get_projects(opts), page_size
+            ):
+                yield project_dict
+
+        except ApiException as e:
+            logger.error("asana_api_error", error=str(e), workspace_gid=workspace_gid)
+            raise
+
+    async def _iter_pages(self, items: Iterator[Any], page_size: int) -> AsyncIterator[dict[str, Any]]:
+        """Drain a lazy SDK item iterator one page per worker-thread hop.
+
+        Args:
+            items: Item iterator returned by a paginated SDK call
+            page_size: The page size the SDK call was made with
+
+        Yields:
+            Items as dicts
+        """
+        while True:
+            page = await asyncio.to_thread(lambda: list(itertools.islice(items, page_size)))
+            for item in page:
+                yield item if isinstance(item, dict) else item.to_dict()
+            # A short page is the last one; no need for another thread hop
+            if len(page) < page_size:
+                return
+
+    @asana_retry
+    async def search_tasks(
+        self,
+        workspace_gid: str,
+        text: str,
+        project_gid: str | None = None,
+        limit: int = 20,
+    ) -> list[AsanaTask]:
+        """Search a workspace for tasks matching some text.
+
+        Only matching tasks are transferred, unlike get_tasks_from_project.
+        Search is a premium Asana feature (other workspaces get a 402) and is
+        eventually consistent, so very recent changes may not show up yet.
+
+        Args:
+            workspace_gid: The GID of the workspace to search
+            text: Text to match against task names and descriptions
+            project_gid: Optional project to restrict the search to
+            limit: Maximum number of results (Asana caps this at 100)
 
-            # Run synchronous Asana API call in thread pool
+        Returns:
+            List of matching AsanaTask objects
+        """
+        try:
+            opts = {
+                "text": text,
+                "limit": limit,
+                "opt_fields": "name,completed,created_at,modified_at,permalink_url",
+            }
+            if project_gid:
+                opts["projects.any"] = project_gid
+
+            # Search results come back as a single page; drain it in the worker thread
             tasks_response = await asyncio.to_thread(
-                self.tasks_api.get_tasks_for_project,
-                project_gid,
-                {"opt_fields": ",".join(opt_fields)},
+                lambda: list(self.tasks_api.search_tasks_for_workspace(workspace_gid, opts))
             )
 
-            tasks = []
-            for task_data in tasks_response:
-                task_dict = task_data if isinstance(task_data, dict) else task_data.to_dict()
-                # Optionally filter for assigned tasks
-                if assigned_only and (
-                    not task_dict.get("assignee") or task_dict.get("completed")
-                ):
-                    continue
-
-                tasks.append(self._parse_task(task_dict))
+            tasks = [
+                self._parse_task(task_data if isinstance(task_data, dict) else task_data.to_dict())
+                for task_data in tasks_response
+            ]
 
             logger.info(
-                "fetched_tasks_from_project",
+                "searched_tasks",
+                workspace_gid=workspace_gid,
                 project_gid=project_gid,
                 task_count=len(tasks),
-                assigned_only=assigned_only,
             )
             return tasks
 
         except ApiException as e:
-            logger.error("asana_api_error", error=str(e), project_gid=project_gid)
+            logger.error("asana_api_error", error=str(e), workspace_gid=workspace_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
+    async def typeahead(
+        self,
+        workspace_gid: str,
+        resource_type: str,
+        query: str,
+        count: int = 20,
+        opt_fields: str = "name,gid",
+    ) -> list[dict]:
+        """Search a workspace by name with Asana's typeahead endpoint.
+
+        Matching happens server-side, so only the few best matches are
+        transferred instead of every object in the workspace. Results are
+        ranked for auto-completion rather than exhaustive, so callers should
+        still check the names they get back.
+
+        Args:
+            workspace_gid: The GID of the workspace to search
+            resource_type: Singular resource type (e.g. "project", "task", "user")
+            query: Text to match against object names
+            count: Maximum number of results (Asana caps this at 100)
+            opt_fields: Comma-separated fields to return for each match
+
+        Returns:
+            List of matching objects as dicts
+        """
+        try:
+            opts = {"query": query, "count": count, "opt_fields": opt_fields}
+            # Typeahead returns a single, unpaginated page; drain it in the worker thread
+            results = await asyncio.to_thread(
+                lambda: list(self.typeahead_api.typeahead_for_workspace(workspace_gid, resource_type, opts))
+            )
+
+            logger.info(
+                "typeahead_searched",
+                workspace_gid=workspace_gid,
+                resource_type=resource_type,
+                result_count=len(results),
+            )
+            return results
+
+        except ApiException as e:
+            logger.error("asana_api_error", error=str(e), workspace_gid=workspace_gid)
+            raise
+
+    @asana_retry
     async def get_task(self, task_gid: str) -> AsanaTask:
         """Get a single task by GID.
 
@@ -198,11 +612,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), task_gid=task_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def update_task(self, task_gid: str, updates: AsanaTaskUpdate) -> AsanaTask:
         """Update a task.
 
@@ -229,11 +639,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), task_gid=task_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def add_comment(
         self, task_gid: str, text: str, is_html: bool = False
     ) -> AsanaComment:
@@ -286,11 +692,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), task_gid=task_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def get_comments(self, task_gid: str) -> list[AsanaComment]:
         """Get all comments/stories for a task.
 
@@ -300,45 +702,50 @@ class AsanaClient:
         Returns:
             List of AsanaComment objects
         """
-        try:
-            opt_fields = ["created_at", "created_by.name", "created_by.email", "text", "type"]
+        comments = [comment async for comment in self.iter_comments(task_gid, page_size=100)]
+        logger.info("fetched_comments", task_gid=task_gid, comment_count=len(comments))
+        return comments
 
-            stories_response = await asyncio.to_thread(
-                self.stories_api.get_stories_for_task,
-                task_gid,
-                {"opt_fields": ",".join(opt_fields)},
-            )
+    async def iter_comments(self, task_gid: str, page_size: int = 20) -> AsyncIterator[AsanaComment]:
+        """Iterate over a task's comments, oldest first.
+
+        Stories are paged lazily, one worker-thread hop per page, so a caller
+        that stops at the first interesting comment skips the remaining pages.
+        System stories are skipped.
 
-            comments = []
-            for story_obj in stories_response:
-                story_dict = story_obj if isinstance(story_obj, dict) else story_obj.to_dict()
+        Args:
+            task_gid: The GID of the task
+            page_size: Stories per page request (Asana caps this at 100)
+
+        Yields:
+            AsanaComment objects
+        """
+        opt_fields = ["created_at", "created_by.name", "created_by.email", "text", "type"]
+        # Building the SDK iterator is lazy; requests happen as it is consumed
+        stories_iter = self.stories_api.get_stories_for_task(
+            task_gid, {"opt_fields": ",".join(opt_fields), "limit": page_size}
+        )
+
+        try:
+            async for story_dict in self._iter_pages(stories_iter, page_size):
                 # Only include comment stories, not system stories
                 if story_dict.get("type") == "comment" and story_dict.get("text"):
-                    comments.append(
-                        AsanaComment(
-                            gid=story_dict["gid"],
-                            created_at=story_dict["created_at"],
-                            created_by=AsanaUser(
-                                gid=story_dict["created_by"]["gid"],
-                                name=story_dict["created_by"]["name"],
-                                email=story_dict["created_by"].get("email"),
-                            ),
-                            text=story_dict["text"],
-                        )
+                    yield AsanaComment(
+                        gid=story_dict["gid"],
+                        created_at=story_dict["created_at"],
+                        created_by=AsanaUser(
+                            gid=story_dict["created_by"]["gid"],
+                            name=story_dict["created_by"]["name"],
+                            email=story_dict["created_by"].get("email"),
+                        ),
+                        text=story_dict["text"],
                     )
 
-            logger.info("fetched_comments", task_gid=task_gid, comment_count=len(comments))
-            return comments
-
         except ApiException as e:
             logger.error("asana_api_error", error=str(e), task_gid=task_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def get_project(self, project_gid: str) -> AsanaProject:
         """Get project details.
 
@@ -348,6 +755,11 @@ class AsanaClient:
         Returns:
             AsanaProject object
         """
+        cached = self._cache_get(("project", project_gid))
+        if cached is not None:
+            # Copied so callers can't mutate the shared cached model
+            return cached.model_copy()
+
         try:
             opt_fields = ["name", "notes", "archived", "public", "workspace"]
 
@@ -366,6 +778,7 @@ class AsanaClient:
             )
 
             logger.info("fetched_project", project_gid=project_gid, project_name=project.name)
+            self._cache_set(("project", project_gid), project.model_copy())
             return project
 
         except ApiException as e:
@@ -433,11 +846,7 @@ class AsanaClient:
             custom_fields=task_data.get("custom_fields", []),
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def get_me(self) -> AsanaUser:
         """Get the authenticated user.
 
@@ -464,25 +873,29 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), operation="get_me")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
-    async def get_sections(self, project_gid: str) -> list[AsanaSection]:
+    @asana_retry
+    async def get_sections(
+        self, project_gid: str, opt_fields: str = "name,gid,project.name"
+    ) -> list[AsanaSection]:
         """Get all sections in a project.
 
         Args:
             project_gid: The GID of the project
+            opt_fields: Comma-separated fields to fetch (must include name)
 
         Returns:
             List of AsanaSection objects
         """
+        cache_key = ("sections", project_gid, opt_fields)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return [section.model_copy() for section in cached]
+
         try:
             sections_response = await asyncio.to_thread(
                 self.sections_api.get_sections_for_project,
                 project_gid,
-                {"opt_fields": "name,gid,project.name"},
+                {"opt_fields": opt_fields},
             )
 
             sections = []
@@ -497,17 +910,14 @@ class AsanaClient:
                 )
 
             logger.info("fetched_sections", project_gid=project_gid, section_count=len(sections))
+            self._cache_set(cache_key, [section.model_copy() for section in sections])
             return sections
 
         except ApiException as e:
             logger.error("asana_api_error", error=str(e), project_gid=project_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def create_section(self, project_gid: str, section_name: str) -> AsanaSection:
         """Create a new section in a project.
 
@@ -532,17 +942,14 @@ class AsanaClient:
             )
 
             logger.info("created_section", project_gid=project_gid, section_name=section_name)
+            self.invalidate_cache("sections", project_gid)
             return section
 
         except ApiException as e:
             logger.error("asana_api_error", error=str(e), project_gid=project_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def update_section(
         self, section_gid: str, name: str | None = None
     ) -> AsanaSection:
@@ -574,17 +981,15 @@ class AsanaClient:
             )
 
             logger.info("updated_section", section_gid=section_gid, updates=list(data.keys()))
+            # The owning project isn't known here, so drop all section lists
+            self.invalidate_cache("sections")
             return section
 
         except ApiException as e:
             logger.error("asana_api_error", error=str(e), section_gid=section_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def reorder_section(
         self, project_gid: str, section_gid: str, after_section_gid: str | None = None, before_section_gid: str | None = None
     ) -> None:
@@ -609,6 +1014,7 @@ class AsanaClient:
                 {"body": {"data": data}},
             )
 
+            self.invalidate_cache("sections", project_gid)
             logger.info(
                 "reordered_section",
                 section_gid=section_gid,
@@ -620,11 +1026,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), section_gid=section_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def move_task_to_section(self, task_gid: str, project_gid: str, section_gid: str) -> None:
         """Move a task to a specific section within a project.
 
@@ -679,11 +1081,7 @@ class AsanaClient:
 
         return section_map
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def get_tasks_for_section(self, section_gid: str) -> list[AsanaTask]:
         """Get all tasks in a specific section.
 
@@ -804,11 +1202,7 @@ class AsanaClient:
 
         return updated_task
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def create_task(
         self,
         project_gid: str,
@@ -932,17 +1326,13 @@ class AsanaClient:
         logger.info("fetched_teammates", project_gid=project_gid, teammate_count=len(teammates))
         return teammates
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def create_project(
         self,
         workspace_gid: str,
         name: str,
         notes: str | None = None,
-        public: bool = True,
+        public: bool | None = None,
         team_gid: str | None = None,
     ) -> AsanaProject:
         """Create a new project in a workspace.
@@ -951,7 +1341,8 @@ class AsanaClient:
             workspace_gid: The GID of the workspace
             name: Project name
             notes: Project description/notes
-            public: Whether the project is public to the workspace
+            public: Whether the project is public to the workspace (None uses
+                the workspace default)
             team_gid: The GID of the team (required for organizations)
 
         Returns:
@@ -965,12 +1356,14 @@ class AsanaClient:
                 project_data["notes"] = notes
             if team_gid:
                 project_data["team"] = team_gid
+            if public is not None:
+                project_data["public"] = public
 
             project_response = await asyncio.to_thread(
                 self.projects_api.create_project_for_workspace,
                 {"data": project_data},
                 workspace_gid,
-                {"opt_fields": "name,gid,notes,archived,public"},
+                {"opt_fields": "name,gid,notes,archived,public,permalink_url"},
             )
 
             project_dict = project_response if isinstance(project_response, dict) else project_response.to_dict()
@@ -980,6 +1373,7 @@ class AsanaClient:
                 notes=project_dict.get("notes"),
                 archived=project_dict.get("archived", False),
                 public=project_dict.get("public", False),
+                permalink_url=project_dict.get("permalink_url"),
             )
 
             logger.info("created_project", workspace_gid=workspace_gid, project_name=name)
@@ -989,11 +1383,37 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), workspace_gid=workspace_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
+    async def get_teams(self, workspace_gid: str, limit: int | None = None) -> list[dict]:
+        """Get the teams in a workspace.
+
+        Args:
+            workspace_gid: The GID of the workspace (organization)
+            limit: Stop after this many teams
+
+        Returns:
+            List of team dicts with gid and name
+        """
+        try:
+            opts = {"opt_fields": "name"}
+            if limit:
+                opts["limit"] = min(limit, 100)
+
+            # Drain the SDK's lazy iterator in the worker thread, stopping at limit
+            teams = await asyncio.to_thread(
+                lambda: list(itertools.islice(
+                    self.teams_api.get_teams_for_workspace(workspace_gid, opts), limit
+                ))
+            )
+
+            logger.info("fetched_teams", workspace_gid=workspace_gid, team_count=len(teams))
+            return teams
+
+        except ApiException as e:
+            logger.error("asana_api_error", error=str(e), workspace_gid=workspace_gid)
+            raise
+
+    @asana_retry
     async def get_portfolio_projects(self, portfolio_gid: str) -> list[AsanaProject]:
         """Get all projects in a portfolio.
 
@@ -1051,11 +1471,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), workspace_gid=workspace_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def add_project_to_portfolio(self, portfolio_gid: str, project_gid: str) -> None:
         """Add a project to a portfolio.
 
@@ -1080,11 +1496,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), portfolio_gid=portfolio_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def add_reaction_to_story(self, story_gid: str, emoji: str = "thumbs_up") -> None:
         """Add a reaction/emoji to a story (comment).
 
@@ -1107,11 +1519,7 @@ class AsanaClient:
             logger.error("asana_api_error", error=str(e), story_gid=story_gid)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @asana_retry
     async def add_custom_field_to_project(self, project_gid: str, custom_field_gid: str) -> None:
         """Add a custom field to a project.
 
@@ -1139,3 +1547,85 @@ class AsanaClient:
 
 
 
+
+
+class AsanaSaveSession:
+    """Unit of work that coalesces independent Asana writes into batch requests.
+
+    Writes are queued locally and sent together by commit() (or on leaving the
+    ``async with`` block without an error) through AsanaClient.batch. Asana
+    runs batched actions in parallel, so only queue writes that don't depend
+    on each other's results or ordering. commit() returns each write's
+    response; the automatic commit on exit raises AsanaBatchError if any
+    write failed.
+    """
+
+    def __init__(self, client: AsanaClient) -> None:
+        """Initialize save session.
+
+        Args:
+            client: AsanaClient used to submit the batch
+        """
+        self.client = client
+        self.actions: list[dict[str, Any]] = []
+
+    async def __aenter__(self) -> "AsanaSaveSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self.actions:
+            actions = list(self.actions)
+            responses = await self.commit()
+            failures = [
+                (action, response)
+                for action, response in zip(actions, responses)
+                if not is_batch_success(response)
+            ]
+            if failures:
+                raise AsanaBatchError(failures)
+        self.actions.clear()
+
+    def add_comment(self, task_gid: str, text: str, is_html: bool = False) -> None:
+        """Queue a comment on a task (see AsanaClient.add_comment)."""
+        data = {"html_text": text} if is_html else {"text": text}
+        self.actions.append(
+            {"relative_path": f"/tasks/{task_gid}/stories", "method": "post", "data": data}
+        )
+
+    def update_task(self, task_gid: str, updates: AsanaTaskUpdate) -> None:
+        """Queue a task update (see AsanaClient.update_task)."""
+        self.actions.append(
+            {
+                "relative_path": f"/tasks/{task_gid}",
+                "method": "put",
+                "data": updates.model_dump(exclude_none=True),
+            }
+        )
+
+    def mark_complete(self, task_gid: str) -> None:
+        """Queue marking a task complete."""
+        self.update_task(task_gid, AsanaTaskUpdate(completed=True))
+
+    def move_to_section(self, task_gid: str, section_gid: str) -> None:
+        """Queue moving a task into a section (see AsanaClient.move_task_to_section)."""
+        self.actions.append(
+            {
+                "relative_path": f"/sections/{section_gid}/addTask",
+                "method": "post",
+                "data": {"task": task_gid},
+            }
+        )
+
+    async def commit(self, max_concurrency: int = 1) -> list[dict[str, Any]]:
+        """Send all queued writes.
+
+        Args:
+            max_concurrency: Maximum number of batch requests in flight at once
+
+        Returns:
+            One response dict per queued write, in the order they were queued
+        """
+        actions, self.actions = self.actions, []
+        if not actions:
+            return []
+        return await self.client.batch(actions, max_concurrency=max_concurrency)
@@ -30,6 +30,7 @@ class AsanaProject(BaseModel):
     archived: bool = False
     public: bool = False
     workspace_gid: str | None = None
+    permalink_url: str | None = None
 
 
 class AsanaSection(BaseModel):
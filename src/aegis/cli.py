@@ -1098,7 +1098,7 @@ def create(name: str | None, path: str | None):
     console.print("[bold]Aegis Project Setup[/bold]\n")
 
     try:
-        settings = Settings()
+        settings = get_settings()
         client = AsanaClient(settings.asana_access_token)
         tracker = ProjectTracker()
 
@@ -1388,7 +1388,7 @@ def configure(show: bool):
         console.print("[bold]Aegis Configuration[/bold]\n")
 
         try:
-            settings = Settings()
+            settings = get_settings()
 
             console.print("[bold]Asana:[/bold]")
             console.print(f"  Workspace GID: {settings.asana_workspace_gid}")
@@ -1877,7 +1877,7 @@ def test_asana():
         from aegis.asana.client import AsanaClient
 
         try:
-            settings = Settings()
+            settings = get_settings()
             client = AsanaClient(settings.asana_access_token)
 
             # Test portfolio access
@@ -1,5 +1,6 @@
 """Configuration management for Aegis."""
 
+import functools
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -94,16 +95,10 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-_settings: Settings | None = None
-
-
+@functools.cache
 def get_settings() -> Settings:
-    """Get or create settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get or create the process-wide settings instance."""
+    return Settings()
 
 
 def get_priority_weights_from_settings(settings: Settings | None = None):
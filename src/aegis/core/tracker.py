@@ -1,7 +1,10 @@
 """Project tracking management."""
 
 import json
+import os
+import tempfile
 import yaml
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -56,9 +59,19 @@ class ProjectTracker:
             return {}
 
     def _save_projects(self, projects: Dict[str, dict]):
-        """Save projects to file."""
-        with open(self.projects_file, "w") as f:
-            yaml.safe_dump(projects, f)
+        """Save projects to file.
+
+        Writes to a temporary file and renames it into place, so readers never
+        see a partially written projects.yaml.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix=".projects-", suffix=".yaml")
+        try:
+            with os.fdopen(fd, "w") as f:
+                yaml.safe_dump(projects, f)
+            os.replace(tmp_path, self.projects_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def add_project(self, gid: str, name: str, local_path: str | Path, github_repo: str | None = None):
         """Add a project to tracking.
@@ -69,8 +82,6 @@ class ProjectTracker:
             local_path: Local filesystem path
             github_repo: GitHub repository (owner/repo)
         """
-        from datetime import datetime
-
         projects = self._load_projects()
 
         projects[gid] = {
@@ -39,6 +39,8 @@ class WorkQueueItem(Base):
     status = Column(String(50), default="pending", index=True) # pending, assigned, completed, failed
     assigned_to_agent_id = Column(String(100), nullable=True)
     assigned_at = Column(DateTime, nullable=True)
+    # Set only by agents that heartbeat their claims; NULL items are never taken over as stale
+    heartbeat_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
 
     # Context
@@ -46,6 +48,17 @@ class WorkQueueItem(Base):
 
     __table_args__ = (
         Index("idx_queue_pending", "status", "priority"),
+        # Claim/enqueue/release look up active items by resource or by owner.
+        # The resource index is a plain composite: claims bind the status list
+        # as parameters, which SQLite can't match against a partial index's WHERE.
+        Index("idx_queue_resource_status", "resource_id", "resource_type", "status"),
+        # Equality on status, so this partial index does apply
+        Index(
+            "idx_queue_assigned_agent",
+            "assigned_to_agent_id",
+            sqlite_where=status == "assigned",
+            postgresql_where=status == "assigned",
+        ),
     )
 
 
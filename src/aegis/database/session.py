@@ -98,6 +98,12 @@ def init_db(project_gid: str | None = None) -> None:
         # Initialize Master models
         from aegis.database.master_models import Base as MasterBase
         MasterBase.metadata.create_all(engine)
+        # create_all skips existing tables, so add indexes introduced since a
+        # master DB was first created. New columns need an explicit upgrade
+        # (scripts/upgrade_master_db.py).
+        for table in MasterBase.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
     else:
         # Initialize Project models
         from aegis.database.models import Base as ProjectBase
@@ -32,6 +32,8 @@ class MemoryManager:
         """
         self.memory_dir = Path(memory_dir)
         self.memory_dir.mkdir(parents=True, exist_ok=True)
+        # memory_file -> (mtime_ns, size, content) from the last locked read
+        self._read_cache: dict[str, tuple[int, int, str]] = {}
 
     def _get_lock_path(self, memory_file: str) -> Path:
         """Get path to lock file for a memory file.
@@ -146,6 +148,9 @@ class MemoryManager:
     def read(self, memory_file: str, timeout: int = 30) -> str:
         """Read memory file with lock.
 
+        If the file's mtime and size are unchanged since the last read, the
+        cached contents are returned without taking the lock or re-reading.
+
         Args:
             memory_file: Name of memory file to read
             timeout: Maximum seconds to wait for lock
@@ -153,10 +158,24 @@ class MemoryManager:
         Returns:
             Contents of memory file
         """
+        cached = self._read_cache.get(memory_file)
+        if cached is not None:
+            try:
+                stat = (self.memory_dir / memory_file).stat()
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == cached[:2]:
+                return cached[2]
+
         with self.lock(memory_file, timeout=timeout) as path:
-            if path.exists():
-                return path.read_text(encoding="utf-8")
-            return ""
+            if not path.exists():
+                return ""
+            # Stat before reading: a change that lands after the stat makes the
+            # next read miss rather than pinning stale content
+            stat = path.stat()
+            content = path.read_text(encoding="utf-8")
+            self._read_cache[memory_file] = (stat.st_mtime_ns, stat.st_size, content)
+            return content
 
     def write(self, memory_file: str, content: str, timeout: int = 30) -> None:
         """Write memory file with lock.
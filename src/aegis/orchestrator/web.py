@@ -15,7 +15,7 @@ from typing import Any
 
 import structlog
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
 logger = structlog.get_logger(__name__)
 
@@ -34,7 +34,8 @@ class OrchestratorWebServer:
         self.orchestrator = orchestrator
         self.host = host
         self.port = port
-        self.app = FastAPI(title="Aegis Orchestrator Dashboard")
+        # The dashboard polls the JSON endpoints every few seconds; serialize with orjson
+        self.app = FastAPI(title="Aegis Orchestrator Dashboard", default_response_class=ORJSONResponse)
         self.active_websockets: list[WebSocket] = []
 
         # Setup routes
@@ -10,7 +10,7 @@ import structlog
 from sqlalchemy.orm import Session
 
 from aegis.asana.client import AsanaClient
-from aegis.config import Settings
+from aegis.config import get_settings
 from aegis.database.models import Project, SystemState, Task
 from aegis.database.session import get_db_session
 
@@ -261,7 +261,7 @@ async def sync_all(
     Returns:
         Tuple of (synced_projects, synced_tasks)
     """
-    config = Settings()
+    config = get_settings()
     portfolio_gid = portfolio_gid or config.asana_portfolio_gid
     workspace_gid = workspace_gid or config.asana_workspace_gid
 
@@ -0,0 +1,223 @@
+"""Tests for BaseAgent."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from aegis.agents.base import AgentError
+from aegis.agents.triage import TriageAgent
+
+
+@pytest.fixture
+def agent(mock_asana_service, tmp_path):
+    """Create a TriageAgent with the real run_claude_code."""
+    return TriageAgent(asana_service=mock_asana_service, repo_root=tmp_path)
+
+
+def _run_instead(cmd):
+    """Patch subprocess creation to run cmd in place of Claude Code."""
+    create = asyncio.create_subprocess_exec
+
+    async def fake_create(*args, **kwargs):
+        return await create(*cmd, **kwargs)
+
+    return patch("aegis.agents.base.asyncio.create_subprocess_exec", side_effect=fake_create)
+
+
+@pytest.mark.asyncio
+class TestRunClaudeCode:
+    """Tests for BaseAgent.run_claude_code."""
+
+    async def test_streams_output_to_log(self, agent, tmp_path):
+        """Test that headless output is written to the session log and returned."""
+        log_path = tmp_path / "session.log"
+
+        with _run_instead(["cat"]):
+            stdout, stderr, returncode = await agent.run_claude_code(
+                "héllo\nworld\n", log_path=log_path
+            )
+
+        assert stdout == "héllo\nworld\n"
+        assert stderr == ""
+        assert returncode == 0
+        assert log_path.read_text() == stdout
+
+    async def test_tail_lines(self, agent, tmp_path):
+        """Test that only the stdout tail is kept while the log gets everything."""
+        log_path = tmp_path / "session.log"
+
+        with _run_instead(["cat"]):
+            stdout, _, _ = await agent.run_claude_code(
+                "one\ntwo\nthree\nfour", log_path=log_path, tail_lines=2
+            )
+
+        assert stdout == "three\nfour"
+        assert log_path.read_text() == "one\ntwo\nthree\nfour"
+
+    async def test_streaming_child_ignores_stdin(self, agent, tmp_path):
+        """Test that a process exiting without reading its prompt isn't an error."""
+        with _run_instead(["sh", "-c", "exec 0<&-; echo done"]):
+            stdout, _, returncode = await agent.run_claude_code(
+                "x" * (1 << 20), log_path=tmp_path / "session.log"
+            )
+
+        assert (stdout, returncode) == ("done\n", 0)
+
+    async def test_streaming_cancel_kills_process(self, agent, tmp_path):
+        """Test that cancelling a streaming run kills the child process."""
+        procs = []
+        create = asyncio.create_subprocess_exec
+
+        async def fake_create(*args, **kwargs):
+            procs.append(await create("sleep", "5", **kwargs))
+            return procs[-1]
+
+        with patch("aegis.agents.base.asyncio.create_subprocess_exec", side_effect=fake_create):
+            run = asyncio.create_task(
+                agent.run_claude_code("", log_path=tmp_path / "session.log")
+            )
+            while not procs:
+                await asyncio.sleep(0.01)
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+        assert procs[0].returncode is not None
+
+    async def test_captures_output(self, agent):
+        """Test that headless output is captured when no session log is given."""
+        with _run_instead(["cat"]):
+            stdout, stderr, returncode = await agent.run_claude_code("héllo\n")
+
+        assert (stdout, stderr, returncode) == ("héllo\n", "", 0)
+
+    async def test_timeout(self, agent):
+        """Test that a hung headless process is killed and reported as a timeout."""
+        with _run_instead(["sleep", "5"]), pytest.raises(AgentError, match="timeout"):
+            await agent.run_claude_code("", timeout=0.1)
+
+    async def test_streaming_timeout(self, agent, tmp_path):
+        """Test that a hung process is killed and reported as a timeout."""
+        with _run_instead(["sleep", "5"]), pytest.raises(AgentError, match="timeout"):
+            await agent.run_claude_code("", timeout=0.1, log_path=tmp_path / "session.log")
+
+
+@pytest.fixture
+def master_db(tmp_path, monkeypatch):
+    """Point the Master DB at a fresh SQLite file under tmp_path."""
+    from aegis.database import session
+
+    db_url = f"sqlite:///{tmp_path}/master.sqlite"
+    monkeypatch.setattr(session, "get_db_url", lambda project_gid=None: db_url)
+    session.init_db()
+
+
+def _queue_items():
+    from aegis.database.master_models import WorkQueueItem
+    from aegis.database.session import get_db_session
+
+    with get_db_session() as session:
+        return [
+            (item.resource_id, item.status, item.assigned_to_agent_id, item.created_at is not None)
+            for item in session.query(WorkQueueItem).order_by(WorkQueueItem.id)
+        ]
+
+
+def _age_claims(age, heartbeated=True):
+    from datetime import datetime
+
+    from sqlalchemy import update
+
+    from aegis.database.master_models import WorkQueueItem
+    from aegis.database.session import get_db_session
+
+    with get_db_session() as session:
+        session.execute(
+            update(WorkQueueItem).values(
+                assigned_at=datetime.utcnow() - age,
+                heartbeat_at=datetime.utcnow() - age if heartbeated else None,
+            )
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("master_db")
+class TestWorkQueue:
+    """Tests for BaseAgent's Master Queue helpers."""
+
+    async def test_add_work_is_deduplicated(self, agent):
+        """Test that a resource only gets one active work item."""
+        await agent.add_work_to_queue("TriageAgent", "task1", "task")
+        await agent.add_work_to_queue("TriageAgent", "task1", "task")
+
+        assert _queue_items() == [("task1", "pending", None, True)]
+
+    async def test_claim_pending_work(self, agent, mock_asana_service, tmp_path):
+        """Test that a pending item is claimed once, by one agent."""
+        other = TriageAgent(asana_service=mock_asana_service, repo_root=tmp_path)
+        await agent.add_work_to_queue("TriageAgent", "task1", "task")
+
+        assert await agent.claim_resource("task1", "task")
+        assert await agent.claim_resource("task1", "task")
+        assert not await other.claim_resource("task1", "task")
+        assert _queue_items() == [("task1", "assigned", agent.agent_id, True)]
+
+    async def test_claim_batch(self, agent, mock_asana_service, tmp_path):
+        """Test that a batch claim takes the highest-priority pending items once."""
+        other = TriageAgent(asana_service=mock_asana_service, repo_root=tmp_path)
+        await agent.add_work_to_queue("TriageAgent", "low", "task", priority=0)
+        await agent.add_work_to_queue("TriageAgent", "high", "task", priority=5)
+        await agent.add_work_to_queue("TriageAgent", "mid", "task", priority=1)
+        await agent.add_work_to_queue("PlannerAgent", "other", "task", priority=9)
+
+        claimed = await agent.claim_batch("TriageAgent", limit=2)
+        assert [item.resource_id for item in claimed] == ["high", "mid"]
+        assert all(item.assigned_to_agent_id == agent.agent_id for item in claimed)
+
+        claimed = await other.claim_batch("TriageAgent", limit=2)
+        assert [item.resource_id for item in claimed] == ["low"]
+        assert await agent.claim_batch("TriageAgent") == []
+
+    async def test_claim_ad_hoc(self, agent, mock_asana_service, tmp_path):
+        """Test that claiming a resource with no work item creates one."""
+        other = TriageAgent(asana_service=mock_asana_service, repo_root=tmp_path)
+
+        assert await agent.claim_resource("task2", "task")
+        assert not await other.claim_resource("task2", "task")
+        assert _queue_items() == [("task2", "assigned", agent.agent_id, True)]
+
+        await agent.release_resource("task2", "task")
+        assert await other.claim_resource("task2", "task")
+
+    async def test_stale_claim_is_taken_over(self, agent, mock_asana_service, tmp_path):
+        """Test that a claim without recent heartbeats can be claimed by another agent."""
+        from aegis.agents.base import CLAIM_STALE_AFTER
+
+        other = TriageAgent(asana_service=mock_asana_service, repo_root=tmp_path)
+        assert await agent.claim_resource("task3", "task")
+        assert agent._heartbeat_task is not None
+
+        _age_claims(CLAIM_STALE_AFTER * 2)
+        assert await agent.heartbeat_claims() == 1
+        assert not await other.claim_resource("task3", "task")
+
+        _age_claims(CLAIM_STALE_AFTER * 2)
+        assert await other.claim_resource("task3", "task")
+        assert _queue_items() == [("task3", "assigned", other.agent_id, True)]
+
+        await agent.release_resource("task3", "task")
+        await other.release_resource("task3", "task")
+        assert agent._heartbeat_task is None and other._heartbeat_task is None
+        assert _queue_items() == [("task3", "completed", other.agent_id, True)]
+
+    async def test_unheartbeated_claim_is_not_taken_over(self, agent, mock_asana_service, tmp_path):
+        """Test that items assigned without heartbeats (e.g. by the master) are left alone."""
+        from aegis.agents.base import CLAIM_STALE_AFTER
+
+        other = TriageAgent(asana_service=mock_asana_service, repo_root=tmp_path)
+        assert await agent.claim_resource("task4", "task")
+        _age_claims(CLAIM_STALE_AFTER * 2, heartbeated=False)
+
+        assert not await other.claim_resource("task4", "task")
+        await agent.release_resource("task4", "task")
+
@@ -1,6 +1,5 @@
 import asyncio
 import os
-import shutil
 from pathlib import Path
 import pytest
 from aegis.orchestrator.master import MasterProcess
@@ -8,13 +7,11 @@ from aegis.database.session import get_db_session
 from aegis.database.master_models import AgentState, WorkQueueItem
 
 @pytest.mark.asyncio
-async def test_master_process_startup():
+async def test_master_process_startup(tmp_path):
     """Test that MasterProcess starts, initializes DB, and spawns agents."""
 
-    # Setup test environment
-    test_dir = Path.cwd() / ".aegis_test"
-    if test_dir.exists():
-        shutil.rmtree(test_dir)
+    # Setup test environment outside the repo checkout
+    test_dir = tmp_path / ".aegis_test"
     test_dir.mkdir()
 
     # Mock .aegis dir
@@ -106,4 +103,3 @@ async def test_master_process_startup():
         await master.stop()
         await task
         os.chdir(original_cwd)
-        # shutil.rmtree(test_dir) # Cleanup
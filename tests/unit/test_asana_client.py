@@ -2,10 +2,17 @@
 
 from unittest.mock import MagicMock, patch
 
+import asana
 import pytest
 from asana.rest import ApiException
-
-from aegis.asana.client import AsanaClient
+from tenacity import wait_none
+
+from aegis.asana.client import (
+    AsanaBatchError,
+    AsanaClient,
+    get_asana_api_client,
+    is_retryable_error,
+)
 from aegis.asana.models import AsanaTaskUpdate
 
 
@@ -56,6 +63,131 @@ class TestAsanaClient:
             assert len(tasks) == 1
             assert tasks[0].gid == "11111"
 
+    @pytest.mark.asyncio
+    async def test_iter_task_dicts_stops_early(self, client: AsanaClient) -> None:
+        """Test that breaking out of iter_task_dicts skips later pages."""
+        consumed = []
+
+        def fake_tasks(project_gid: str, opts: dict):
+            for i in range(250):
+                consumed.append(i)
+                yield {"gid": str(i), "name": f"Task {i}"}
+
+        with patch.object(client.tasks_api, "get_tasks_for_project", side_effect=fake_tasks):
+            async for task in client.iter_task_dicts("67890", "name", page_size=100):
+                if task["name"] == "Task 5":
+                    break
+
+        # Only the first page was pulled from the SDK iterator
+        assert len(consumed) == 100
+
+    @pytest.mark.asyncio
+    async def test_search_tasks(self, client: AsanaClient, sample_task_data: dict) -> None:
+        """Test searching a workspace for tasks."""
+        with patch.object(
+            client.tasks_api, "search_tasks_for_workspace", return_value=iter([sample_task_data])
+        ) as mock_search:
+            tasks = await client.search_tasks("99999", "Test Task", project_gid="67890")
+
+            assert len(tasks) == 1
+            assert tasks[0].gid == "11111"
+            workspace_gid, opts = mock_search.call_args.args
+            assert workspace_gid == "99999"
+            assert opts["text"] == "Test Task"
+            assert opts["projects.any"] == "67890"
+
+    @pytest.mark.asyncio
+    async def test_typeahead(self, client: AsanaClient) -> None:
+        """Test server-side name search via the typeahead endpoint."""
+        with patch.object(
+            client.typeahead_api,
+            "typeahead_for_workspace",
+            return_value=iter([{"gid": "123", "name": "Aegis"}]),
+        ) as mock_typeahead:
+            results = await client.typeahead("99999", "project", "aegis", count=5)
+
+            assert results == [{"gid": "123", "name": "Aegis"}]
+            workspace_gid, resource_type, opts = mock_typeahead.call_args.args
+            assert (workspace_gid, resource_type) == ("99999", "project")
+            assert opts["query"] == "aegis"
+            assert opts["count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_typeahead_retries_rate_limits(self, client: AsanaClient) -> None:
+        """Test that a rate-limited typeahead search is retried."""
+        with patch.object(AsanaClient.typeahead.retry, "wait", wait_none()), patch.object(
+            client.typeahead_api,
+            "typeahead_for_workspace",
+            side_effect=[ApiException(status=429), iter([{"gid": "123", "name": "Aegis"}])],
+        ) as mock_typeahead:
+            results = await client.typeahead("99999", "project", "aegis")
+
+        assert results == [{"gid": "123", "name": "Aegis"}]
+        assert mock_typeahead.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_chunks_actions(self, client: AsanaClient) -> None:
+        """Test that batch splits actions into requests of at most 10."""
+        actions = [{"relative_path": f"/tasks/{i}", "method": "delete"} for i in range(23)]
+
+        def fake_batch(body: dict, opts: dict):
+            return iter([{"status_code": 200, "body": {}}] * len(body["data"]["actions"]))
+
+        with patch.object(
+            client.batch_api, "create_batch_request", side_effect=fake_batch
+        ) as mock_batch:
+            responses = await client.batch(actions)
+
+            assert len(responses) == 23
+            assert [len(c.args[0]["data"]["actions"]) for c in mock_batch.call_args_list] == [10, 10, 3]
+
+    @pytest.mark.asyncio
+    async def test_batch_isolates_failed_requests(self, client: AsanaClient) -> None:
+        """Test that a failed batch request fails only its own actions."""
+        actions = [{"relative_path": f"/tasks/{i}", "method": "delete"} for i in range(15)]
+
+        def fake_batch(body: dict, opts: dict):
+            if body["data"]["actions"][0]["relative_path"] == "/tasks/0":
+                raise ApiException(status=400, reason="Bad Request")
+            return iter([{"status_code": 200, "body": {}}] * len(body["data"]["actions"]))
+
+        with patch.object(client.batch_api, "create_batch_request", side_effect=fake_batch):
+            responses = await client.batch(actions, max_concurrency=2)
+
+        assert [r["status_code"] for r in responses] == [400] * 10 + [200] * 5
+        assert "Bad Request" in responses[0]["body"]["errors"][0]["message"]
+
+    @pytest.mark.asyncio
+    async def test_save_session_raises_on_failed_write(self, client: AsanaClient) -> None:
+        """Test that the automatic commit raises if any queued write failed."""
+        responses = [{"status_code": 200, "body": {}}, {"status_code": 403, "body": {}}]
+
+        with patch.object(client, "batch", return_value=responses):
+            with pytest.raises(AsanaBatchError, match="PUT /tasks/11111 -> 403") as exc_info:
+                async with client.save_session() as session:
+                    session.add_comment("11111", "Done")
+                    session.mark_complete("11111")
+
+        assert [action["method"] for action, _ in exc_info.value.failures] == ["put"]
+
+    @pytest.mark.asyncio
+    async def test_save_session_commits_on_exit(self, client: AsanaClient) -> None:
+        """Test that queued writes are sent as one batch when the block exits."""
+        with patch.object(client, "batch", return_value=[]) as mock_batch:
+            async with client.save_session() as session:
+                session.add_comment("11111", "Done")
+                session.mark_complete("11111")
+                session.move_to_section("11111", "22222")
+
+            mock_batch.assert_called_once()
+            actions = mock_batch.call_args.args[0]
+            assert [a["relative_path"] for a in actions] == [
+                "/tasks/11111/stories",
+                "/tasks/11111",
+                "/sections/22222/addTask",
+            ]
+            assert actions[1]["data"] == {"completed": True}
+
     @pytest.mark.asyncio
     async def test_get_task(self, client: AsanaClient, sample_task_data: dict) -> None:
         """Test fetching a single task."""
@@ -139,6 +271,30 @@ class TestAsanaClient:
             assert comments[0].text == "Comment 1"
             assert comments[1].text == "Comment 2"
 
+    @pytest.mark.asyncio
+    async def test_iter_comments_stops_early(self, client: AsanaClient) -> None:
+        """Test that breaking out of iter_comments skips later story pages."""
+        consumed = []
+
+        def fake_stories(task_gid: str, opts: dict):
+            for i in range(100):
+                consumed.append(i)
+                yield {
+                    "gid": str(i),
+                    "created_at": "2025-01-01T12:00:00.000Z",
+                    "created_by": {"gid": "12345", "name": "Test User"},
+                    "text": f"Comment {i}",
+                    "type": "comment",
+                }
+
+        with patch.object(client.stories_api, "get_stories_for_task", side_effect=fake_stories):
+            async for comment in client.iter_comments("11111", page_size=20):
+                if comment.text == "Comment 3":
+                    break
+
+        # Only the first page was pulled from the SDK iterator
+        assert len(consumed) == 20
+
     @pytest.mark.asyncio
     async def test_get_project(self, client: AsanaClient) -> None:
         """Test fetching project details."""
@@ -161,6 +317,37 @@ class TestAsanaClient:
             assert project.archived is False
             assert project.public is True
 
+    @pytest.mark.asyncio
+    async def test_get_project_is_cached(self) -> None:
+        """Test that repeat project lookups are served from the opt-in TTL cache."""
+        client = AsanaClient(access_token="test_token", cache_ttl=300)
+        project_data = {"gid": "67890", "name": "Test Project"}
+
+        with patch("asyncio.to_thread") as mock_to_thread:
+            mock_to_thread.return_value = project_data
+
+            first = await client.get_project("67890")
+            first.name = "Mutated"
+            second = await client.get_project("67890")
+
+            assert second.name == "Test Project"
+            assert mock_to_thread.call_count == 1
+
+            client.invalidate_cache(project_gid="67890")
+            await client.get_project("67890")
+            assert mock_to_thread.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_project_not_cached_by_default(self, client: AsanaClient) -> None:
+        """Test that long-lived clients refetch projects unless caching is enabled."""
+        with patch("asyncio.to_thread") as mock_to_thread:
+            mock_to_thread.return_value = {"gid": "67890", "name": "Test Project"}
+
+            await client.get_project("67890")
+            await client.get_project("67890")
+
+            assert mock_to_thread.call_count == 2
+
     @pytest.mark.asyncio
     async def test_api_exception_handling(self, client: AsanaClient) -> None:
         """Test that API exceptions are properly raised."""
@@ -197,3 +384,37 @@ class TestAsanaClient:
         assert task.name == "Minimal Task"
         assert task.assignee is None
         assert len(task.projects) == 0
+
+
+class TestRetryPolicy:
+    """Tests for the Asana retry predicate."""
+
+    @pytest.mark.parametrize("status", [0, 429, 500, 503])
+    def test_transient_errors_are_retried(self, status: int) -> None:
+        """Rate limits, server errors and transport failures are retried."""
+        assert is_retryable_error(ApiException(status=status)) is True
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404])
+    def test_client_errors_are_not_retried(self, status: int) -> None:
+        """Permanent client errors fail immediately."""
+        assert is_retryable_error(ApiException(status=status)) is False
+
+    def test_unrelated_errors_are_not_retried(self) -> None:
+        """Programming errors are never retried."""
+        assert is_retryable_error(ValueError("bad input")) is False
+
+
+class TestApiClient:
+    """Tests for the shared low-level API client."""
+
+    def test_deserialize_matches_sdk(self) -> None:
+        """Test that the orjson parser matches the SDK's JSON handling."""
+        response = MagicMock()
+        # Non-breaking spaces are normalised to plain spaces by the SDK
+        response.data = '{"data": [{"gid": "1", "name": "a\xa0b", "notes": "\xe9\xa0"}]}'.encode()
+
+        result = get_asana_api_client("test_token").deserialize(response, object)
+        expected = asana.ApiClient(asana.Configuration()).deserialize(response, object)
+
+        assert result == expected
+        assert result == {"data": [{"gid": "1", "name": "a b", "notes": "\xe9 "}]}
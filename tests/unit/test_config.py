@@ -119,10 +119,8 @@ class TestGetSettings:
 
     def test_get_settings_singleton(self) -> None:
         """Test that get_settings returns the same instance."""
-        # Reset the global settings
-        import aegis.config
-
-        aegis.config._settings = None
+        # Reset the cached settings
+        get_settings.cache_clear()
 
         with patch.dict(
             os.environ,
@@ -0,0 +1,34 @@
+"""Unit tests for MemoryManager."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from aegis.infrastructure.memory_manager import MemoryManager
+
+
+class TestMemoryManagerRead:
+    """Test MemoryManager.read caching."""
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path: Path) -> None:
+        """Test that a second read of an unchanged file skips the lock."""
+        manager = MemoryManager(tmp_path)
+        (tmp_path / "swarm_memory.md").write_text("memory", encoding="utf-8")
+
+        assert manager.read("swarm_memory.md") == "memory"
+        with patch.object(manager, "lock") as mock_lock:
+            assert manager.read("swarm_memory.md") == "memory"
+            mock_lock.assert_not_called()
+
+    def test_changed_file_is_reread(self, tmp_path: Path) -> None:
+        """Test that an external edit is picked up on the next read."""
+        manager = MemoryManager(tmp_path)
+        path = tmp_path / "user_preferences.md"
+        path.write_text("old", encoding="utf-8")
+        assert manager.read("user_preferences.md") == "old"
+
+        path.write_text("new!", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.read("user_preferences.md") == "new!"